@@ -16,6 +16,16 @@ DEFAULT_CONFIG = {
     "OPENAI_API_KEY": None,                       # API-Key setzen oder aus Umgebungsvariable (Standard: None)
     "MAX_TOKENS": 16000,                          # Maximale Tokenanzahl pro Anfrage
     "TEMPERATURE": 0.2,                           # Sampling-Temperatur
+    "LLM_MAX_ASYNC": 16,                          # Maximale Anzahl paralleler LLM-Anfragen im Batch-Modus
+    "LLM_MAX_CONCURRENCY": 16,                    # Maximale Anzahl HTTP-Verbindungen des asynchronen LLM-Clients
+    "LLM_MAX_RETRIES": 5,                         # Maximale Anzahl Versuche bei LLM-Rate-Limits
+    "LLM_RPM": None,                              # Anfragen pro Minute für den asynchronen Batch-Modus (None = unbegrenzt)
+    "LLM_TPM": None,                              # Tokens pro Minute für den asynchronen Batch-Modus (None = unbegrenzt)
+    "USE_BATCH_API": False,                       # OpenAI Batch API für Massenextraktion nutzen (günstiger, Ergebnis innerhalb 24h)
+    "BATCH_API_POLL_MIN": 5,                      # Anfangsintervall in Sekunden für Statusabfragen der Batch API
+    "BATCH_API_POLL_MAX": 300,                    # Maximales Intervall in Sekunden für Statusabfragen der Batch API
+    "MAX_TEXTS_PER_REQUEST": 8,                   # Maximale Anzahl kurzer Texte pro LLM-Anfrage (extract_entities_multi)
+    "MAX_CHARS_PER_MULTI_REQUEST": 24000,         # Maximale Gesamtlänge in Zeichen für eine Mehrfachtext-Anfrage
 
     # === LANGUAGE SETTINGS ===
     "LANGUAGE": "en",           # Sprache der Verarbeitung (de oder en)
@@ -83,17 +93,37 @@ DEFAULT_CONFIG = {
     "TIMEOUT_THIRD_PARTY": 15,       # Timeout für externe Dienste (Wikipedia, Wikidata, DBpedia)
     "RATE_LIMIT_MAX_CALLS": 3,       # Maximale Anzahl Aufrufe pro Zeitraum
     "RATE_LIMIT_PERIOD": 1,          # Zeitraum in Sekunden
+    "RATE_LIMIT_HOST_MAX_CALLS": {   # Aufrufe pro Zeitraum je Host (oder Domain), eigenes Limit pro Host
+        "www.wikidata.org": 10,
+        "wikipedia.org": 50,
+    },
     "RATE_LIMIT_BACKOFF_BASE": 1,    # Basiswert für exponentielles Backoff
     "RATE_LIMIT_BACKOFF_MAX": 60,    # Maximale Wartezeit bei Backoff
     "USER_AGENT": "EntityExtractor/1.0", # HTTP User-Agent-Header
+    "HTTP_RETRY_TOTAL": 5,           # Maximale Wiederholungen bei Verbindungsfehlern und HTTP 429/5xx (gepoolte Sessions)
+    "HTTP_RETRY_BACKOFF_FACTOR": 0.5, # Faktor für exponentielles Backoff zwischen Wiederholungen
+    "HTTP_RETRY_BACKOFF_JITTER": 0.3, # Zufälliger Jitter in Sekunden pro Wiederholung
     "WIKIPEDIA_MAXLAG": 5,           # Maxlag-Parameter für Wikipedia-API
+    "WIKIPEDIA_MAXLAG_RETRIES": 2,   # Wiederholungen nach Maxlag-Fehlern (Wartezeit laut Retry-After)
+    "WIKIDATA_CONCURRENCY": 8,       # Maximale Anzahl paralleler Wikidata-Anfragen (Thread-Pool)
+    "WIKIPEDIA_CONCURRENCY": 8,      # Maximale Anzahl paralleler Wikipedia-Anfragen (Thread-Pool und prozessweites Limit)
+    "DBPEDIA_CONCURRENCY": 4,        # Maximale Anzahl gleichzeitiger DBpedia-Lookup-Anfragen
+    "ADAPTIVE_CONCURRENCY_INCREASE": 0.5,  # Additive Erhöhung der Parallelität pro erfolgreicher Antwort (AIMD α)
+    "ADAPTIVE_CONCURRENCY_DECREASE": 0.5,  # Multiplikative Verringerung der Parallelität bei HTTP 429/503 (AIMD β)
 
     # === CACHING SETTINGS ===
     "CACHE_ENABLED": True,   # Caching global aktivieren oder deaktivieren
     "CACHE_DIR": os.path.join(os.path.dirname(os.path.dirname(__file__)), "cache"),    # Verzeichnis für Cache-Dateien innerhalb des Pakets (bei Bedarf erstellen)
     "CACHE_DBPEDIA_ENABLED": True,              # Caching für DBpedia-SPARQL-Abfragen aktivieren
     "CACHE_WIKIDATA_ENABLED": True,             # (Optional) Caching für Wikidata-API aktivieren
+    "CACHE_WIKIDATA_FORMAT": "json",            # Format der Wikidata-Details im Cache: "json" oder "pickle5" (schneller, nur für diese Python-Version)
     "CACHE_WIKIPEDIA_ENABLED": True,            # (Optional) Caching für Wikipedia-API-Anfragen aktivieren
+    "WIKIPEDIA_NEG_TTL": 86400,                 # Gültigkeit in Sekunden für gecachte Fehlschläge (kein Extract, keine Übersetzung)
+    "CACHE_OPENAI_ENABLED": True,               # Caching der LLM-Extraktionsergebnisse aktivieren
+    "CACHE_LLM_ENABLED": True,                  # Caching von LLM-Übersetzungen und -Synonymen für die Wikidata-Suche aktivieren
+    "CACHE_SEMANTIC_ENABLED": False,            # Semantischen Cache für ähnliche Texte aktivieren (erfordert numpy + sentence-transformers oder fastembed)
+    "CACHE_SEMANTIC_THRESHOLD": 0.95,           # Minimale Kosinus-Ähnlichkeit für einen Treffer im semantischen Cache
+    "CACHE_SEMANTIC_MODEL": "sentence-transformers/all-MiniLM-L6-v2",  # Lokales Embedding-Modell für den semantischen Cache
 
     # === LOGGING AND DEBUG SETTINGS ===
     "SHOW_STATUS": True,            # Statusmeldungen anzeigen
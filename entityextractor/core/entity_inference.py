@@ -24,6 +24,10 @@ DEFAULT_CONFIG = {
     "TEMPERATURE": 0.2,
 }
 
+# Feldnamen für Name und Typ einer Entität, in Prioritätsreihenfolge
+_NAME_ALIASES = ("entity", "name")
+_TYPE_ALIASES = ("entity_type", "type")
+
 def infer_entities(text, entities, user_config=None):
     """
     Ergänzt implizite Entitäten via LLM, wenn ENABLE_ENTITY_INFERENCE=True.
@@ -42,9 +46,11 @@ def infer_entities(text, entities, user_config=None):
     # Einheitliche Abbildung expliziter Entitäten
     explicit = []
     for e in entities:
-        name = e.get("entity") or e.get("name", "")
-        typ = (e.get("entity_type") or e.get("type") or
-               (e.get("details", {}).get("typ") if isinstance(e.get("details"), dict) else None) or "")
+        name = next((e[k] for k in _NAME_ALIASES if e.get(k)), "")
+        typ = next((e[k] for k in _TYPE_ALIASES if e.get(k)), None)
+        if not typ:
+            details = e.get("details")
+            typ = (details.get("typ") if isinstance(details, dict) else None) or ""
         url = e.get("wikipedia_url", "")
         # Preserve original 'inferred' flag (default to explicit if missing)
         inferred_flag = e.get("inferred", "explicit")
@@ -6,13 +6,14 @@ This module provides functions for generating entities related to a specific top
 
 import logging
 import time
-import json
 
 from openai import OpenAI
 from entityextractor.config.settings import get_config, DEFAULT_CONFIG
 from entityextractor.utils.logging_utils import configure_logging
 from entityextractor.utils.text_utils import clean_json_from_markdown
+from entityextractor.utils.jsonl_writer import get_jsonl_writer
 from entityextractor.services.openai_service import save_training_data as save_extraction_training_data
+from entityextractor.services.openai_service import parse_entity_lines
 from entityextractor.core.entity_inference import infer_entities
 from entityextractor.prompts.generation_prompts import (
     get_system_prompt_generate_en,
@@ -62,14 +63,8 @@ def save_training_data(topic, entities, config=None):
             ]
         }
         
-        # Ensure each entity has an 'inferred' field
-        for ent in entities:
-            if "inferred" not in ent:
-                ent["inferred"] = "implicit"
-        
         # Append to the JSONL file
-        with open(training_data_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(example, ensure_ascii=False) + "\n")
+        get_jsonl_writer(training_data_path).write(example)
             
         logging.info(f"Saved generation training example to {training_data_path}")
     except Exception as e:
@@ -161,19 +156,7 @@ def generate_entities(topic, user_config=None):
         
         # Parse semicolon-separated entity lines
         raw_output = response.choices[0].message.content.strip()
-        lines = raw_output.splitlines()
-        processed_entities = []
-        for ln in lines:
-            parts = [p.strip() for p in ln.split(';')]
-            if len(parts) >= 4:
-                name, typ, url, citation = parts[:4]
-                processed_entities.append({
-                    'name': name,
-                    'type': typ,
-                    'wikipedia_url': url,
-                    'citation': citation,
-                    'inferred': 'implicit'
-                })
+        processed_entities = parse_entity_lines(raw_output, 'implicit')
         elapsed_time = time.time() - generation_start_time
         logging.info(f"Generated {len(processed_entities)} entities in {elapsed_time:.2f} seconds")
         # Save training data if enabled
@@ -89,7 +89,7 @@ def link_entities(entities, text=None, user_config=None):
             else:
                 # 3. Nur wenn kein Extract: Redirect prüfen und Fallback nutzen
                 logging.info(f"No extract found for '{entity_name}' (URL: {wikipedia_url}). Trying redirect/fallback...")
-                final_url, page_title = follow_wikipedia_redirect(wikipedia_url, entity_name)
+                final_url, page_title = follow_wikipedia_redirect(wikipedia_url, entity_name, config)
                 if final_url and final_url != wikipedia_url:
                     logging.info(f"Redirect detected: {wikipedia_url} -> {final_url}")
                     linked_entity["wikipedia_url"] = final_url
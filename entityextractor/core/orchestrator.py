@@ -39,7 +39,7 @@ def process_entities(input_text: str, user_config: dict = None):
         size = config.get("TEXT_CHUNK_SIZE", 2000)
         overlap = config.get("TEXT_CHUNK_OVERLAP", 50)
         logging.info("[orchestrator] Chunking: size=%d, overlap=%d", size, overlap)
-        chunks = chunk_text(input_text, size, overlap)
+        chunks = list(chunk_text(input_text, size, overlap))
         all_ents, all_rels = [], []
         for i, c in enumerate(chunks, 1):
             logging.info("[orchestrator] Chunk %d/%d", i, len(chunks))
@@ -11,6 +11,8 @@ import logging
 from openai import OpenAI
 from entityextractor.config.settings import get_config
 from entityextractor.utils.logging_utils import configure_logging
+from entityextractor.utils.json_utils import json_loads, json_loads_llm
+from entityextractor.utils.text_utils import clean_json_from_markdown
 from entityextractor.services.openai_service import save_relationship_training_data
 from entityextractor.prompts.relationship_prompts import (
     get_explicit_system_prompt_extract_en,
@@ -43,6 +45,10 @@ DEFAULT_CONFIG = {
     "RELATION_EXTRACTION": False
 }
 
+# Feldnamen für Name und Typ einer Entität, in Prioritätsreihenfolge
+_NAME_ALIASES = ("entity", "name")
+_TYPE_ALIASES = ("entity_type", "type")
+
 def infer_entity_relationships(text, entities, user_config=None):
     """
     Inferiert Beziehungen zwischen Entitäten basierend auf dem Originaltext.
@@ -103,21 +109,12 @@ def infer_entity_relationships(text, entities, user_config=None):
         logging.info(f"Verarbeite Entität {i+1}: {entity.keys()}")
         
         # Versuche, den Namen und Typ aus verschiedenen möglichen Strukturen zu extrahieren
-        entity_name = ""
-        entity_type = ""
-        
-        # Direkte Felder in der Entität
-        if "entity" in entity:
-            entity_name = entity["entity"]
-        elif "name" in entity:
-            entity_name = entity["name"]
-            
-        if "entity_type" in entity:
-            entity_type = entity["entity_type"]
-        elif "type" in entity:
-            entity_type = entity["type"]
-        elif "details" in entity and "typ" in entity["details"]:
-            entity_type = entity["details"]["typ"]
+        # Direkte Felder in der Entität (erster vorhandener Alias gewinnt)
+        entity_name = next((entity[k] for k in _NAME_ALIASES if k in entity), "")
+        entity_type = next((entity[k] for k in _TYPE_ALIASES if k in entity), None)
+        if entity_type is None:
+            details = entity.get("details")
+            entity_type = details["typ"] if details and "typ" in details else ""
         
         # Wikipedia-Label verwenden, falls vorhanden
         if "sources" in entity and "wikipedia" in entity["sources"]:
@@ -374,13 +371,23 @@ def infer_entity_relationships(text, entities, user_config=None):
         logging.error(f"Fehler beim Aufruf der OpenAI API: {e}")
         return []
 
+def _is_relationship_list(value):
+    # Tripel aus der Extraktion bzw. Prädikat-Einträge aus der Deduplizierung haben immer "predicate"
+    return isinstance(value, list) and all(isinstance(v, dict) and "predicate" in v for v in value)
+
 def extract_json_relationships(raw_json):
     # Try to parse as JSON array
-    json_start = raw_json.find('[')
-    json_end = raw_json.rfind(']') + 1
+    cleaned = clean_json_from_markdown(raw_json)
+    json_start = cleaned.find('[')
+    json_end = cleaned.rfind(']') + 1
     if json_start >= 0 and json_end > json_start:
+        # json_repair macht aus jedem geklammerten Text eine Liste (z. B. "Ulm [1]" -> [1]);
+        # reparieren daher nur, wenn die Antwort selbst mit einem JSON-Array beginnt
+        loads = json_loads_llm if cleaned.startswith('[') else json_loads
         try:
-            return json.loads(raw_json[json_start:json_end])
+            result = loads(cleaned[json_start:json_end])
+            if _is_relationship_list(result):
+                return result
         except Exception:
             pass
     # Fallback: parse semicolon-separated lines 'subject; predicate; object'
@@ -3,6 +3,9 @@ Centralized prompts for entity extraction via OpenAI.
 Contains system and user prompts for English and German.
 """
 
+# Bump whenever the prompts change so cached extraction results are invalidated
+PROMPT_VERSION = "1"
+
 def get_system_prompt_en(max_entities):
     return f"""
 You are a helpful AI system for recognizing and linking entities. Think carefully and answer thoroughly and completely.
@@ -70,3 +73,16 @@ TYPE_RESTRICTION_TEMPLATE_DE = (
 # User prompts
 USER_PROMPT_EN = "Text: {text}"
 USER_PROMPT_DE = "Text: {text}"
+
+# Multi-text user prompts (several texts in one request)
+MULTI_TEXT_PROMPT_EN = (
+    "Extract the entities for each of the following numbered texts separately. "
+    "Start the answer for each text with its header line exactly as given (e.g. \"### Text 1\"), "
+    "followed by that text's entities as semicolon-separated lines.\n\n{sections}"
+)
+MULTI_TEXT_PROMPT_DE = (
+    "Extrahiere die Entitäten für jeden der folgenden nummerierten Texte separat. "
+    "Beginne die Antwort für jeden Text mit seiner Kopfzeile genau wie angegeben (z.B. \"### Text 1\"), "
+    "gefolgt von den Entitäten dieses Textes als semikolon-getrennte Zeilen.\n\n{sections}"
+)
+MULTI_TEXT_SECTION = "### Text {index}\n{text}"
@@ -0,0 +1,189 @@
+"""
+Persistent SQLite cache for the Wikidata service.
+
+Resolved values of referenced Wikidata items (keyed by Q-ID and language) are
+stored in a single SQLite database under CACHE_DIR, with an in-process LRU in
+front of it. Items without a value are cached as well, so they are not
+requested again. The same database holds the serialized results of
+get_wikidata_details, keyed by entity ID and language.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+_MEMORY_MAX_ENTRIES = 100_000
+_PRELOAD_MAX_BYTES = 50 * 1024 * 1024
+_MMAP_SIZE = 256 * 1024 * 1024
+
+# Marker für "nicht im Cache" (None ist ein gültiger, gecachter Wert)
+MISS = object()
+
+
+class _LabelCache:
+    def __init__(self, db_path):
+        self.lock = threading.Lock()
+        self.memory = OrderedDict()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # Datenbankdatei per mmap lesen statt über read()-Aufrufe in den Page-Cache zu kopieren
+        self.conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS labels ("
+            "qid TEXT NOT NULL, lang TEXT NOT NULL, value TEXT, PRIMARY KEY (qid, lang))"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS details ("
+            "entity_id TEXT NOT NULL, lang TEXT NOT NULL, data BLOB NOT NULL, PRIMARY KEY (entity_id, lang))"
+        )
+        self.conn.commit()
+        if os.path.getsize(db_path) <= _PRELOAD_MAX_BYTES:
+            for qid, lang, value in self.conn.execute("SELECT qid, lang, value FROM labels LIMIT ?", (_MEMORY_MAX_ENTRIES,)):
+                self.memory[(qid, lang)] = value
+
+    def _remember(self, key, value):
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        if len(self.memory) > _MEMORY_MAX_ENTRIES:
+            self.memory.popitem(last=False)
+
+    def get_many(self, qids, lang):
+        found = {}
+        with self.lock:
+            missing = []
+            for qid in qids:
+                value = self.memory.get((qid, lang), MISS)
+                if value is MISS:
+                    missing.append(qid)
+                else:
+                    self.memory.move_to_end((qid, lang))
+                    found[qid] = value
+            # SQLite erlaubt höchstens 999 Parameter pro Anfrage
+            for start in range(0, len(missing), 900):
+                chunk = missing[start:start + 900]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self.conn.execute(
+                    f"SELECT qid, value FROM labels WHERE lang = ? AND qid IN ({placeholders})",
+                    [lang] + chunk
+                )
+                for qid, value in rows:
+                    self._remember((qid, lang), value)
+                    found[qid] = value
+        return found
+
+    def put_many(self, values, lang):
+        with self.lock:
+            for qid, value in values.items():
+                self._remember((qid, lang), value)
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO labels (qid, lang, value) VALUES (?, ?, ?)",
+                [(qid, lang, value) for qid, value in values.items()]
+            )
+            self.conn.commit()
+
+
+    def get_details(self, entity_id, lang):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT data FROM details WHERE entity_id = ? AND lang = ?", (entity_id, lang)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put_details_many(self, rows):
+        with self.lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO details (entity_id, lang, data) VALUES (?, ?, ?)", rows
+            )
+            self.conn.commit()
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def _get_cache(config):
+    if not (config.get("CACHE_ENABLED") and config.get("CACHE_WIKIDATA_ENABLED")):
+        return None
+    cache_dir = config.get("CACHE_DIR", "cache")
+    with _caches_lock:
+        cache = _caches.get(cache_dir)
+        if cache is None:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                cache = _LabelCache(os.path.join(cache_dir, "wikidata_labels.sqlite"))
+            except sqlite3.Error as e:
+                logging.warning(f"Wikidata label cache unavailable: {e}")
+                return None
+            _caches[cache_dir] = cache
+        return cache
+
+
+def get(qid, lang, config):
+    """
+    Return the cached value for (qid, lang), or MISS.
+    """
+    return get_many([qid], lang, config).get(qid, MISS)
+
+
+def get_many(qids, lang, config):
+    """
+    Return {qid: value} for all cached qids in the given language.
+    """
+    cache = _get_cache(config)
+    if cache is None:
+        return {}
+    try:
+        return cache.get_many(list(qids), lang)
+    except sqlite3.Error as e:
+        logging.warning(f"Failed to read Wikidata label cache: {e}")
+        return {}
+
+
+def put(qid, lang, value, config):
+    """
+    Store the value for (qid, lang).
+    """
+    put_many({qid: value}, lang, config)
+
+
+def put_many(values, lang, config):
+    """
+    Store several {qid: value} pairs for the given language.
+    """
+    cache = _get_cache(config)
+    if cache is None or not values:
+        return
+    try:
+        cache.put_many(values, lang)
+    except sqlite3.Error as e:
+        logging.warning(f"Failed to write Wikidata label cache: {e}")
+
+
+def get_details(entity_id, lang, config):
+    """
+    Return the serialized details of entity_id in the given language, or None.
+    """
+    cache = _get_cache(config)
+    if cache is None:
+        return None
+    try:
+        return cache.get_details(entity_id, lang)
+    except sqlite3.Error as e:
+        logging.warning(f"Failed to read Wikidata details cache: {e}")
+        return None
+
+
+def put_details_many(rows, config):
+    """
+    Store several (entity_id, lang, data) rows in one transaction.
+    """
+    cache = _get_cache(config)
+    if cache is None or not rows:
+        return
+    try:
+        cache.put_details_many(rows)
+    except sqlite3.Error as e:
+        logging.warning(f"Failed to write Wikidata details cache: {e}")
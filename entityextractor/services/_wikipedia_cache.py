@@ -0,0 +1,101 @@
+"""
+Persistent SQLite cache for the Wikipedia service.
+
+Extracts, summaries and interlanguage titles are stored as JSON blobs in a
+single SQLite database under CACHE_DIR instead of one file per URL. Keys are
+the BLAKE2b digest of the URL (or lookup key) plus the kind of entry, so one
+lookup is a single B-tree probe on an already open connection.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+
+from entityextractor.utils.json_utils import json_dumps_bytes, json_loads
+
+
+class _CacheStore:
+    def __init__(self, db_path):
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS wiki_cache ("
+            "key TEXT PRIMARY KEY, kind TEXT NOT NULL, value BLOB NOT NULL)"
+        )
+        self.conn.commit()
+
+    def get(self, key):
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM wiki_cache WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put_many(self, rows):
+        with self.lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO wiki_cache (key, kind, value) VALUES (?, ?, ?)", rows
+            )
+            self.conn.commit()
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def _get_store(config):
+    if not (config.get("CACHE_ENABLED") and config.get("CACHE_WIKIPEDIA_ENABLED")):
+        return None
+    cache_dir = config.get("CACHE_DIR", "cache")
+    with _stores_lock:
+        store = _stores.get(cache_dir)
+        if store is None:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                store = _CacheStore(os.path.join(cache_dir, "wikipedia.sqlite"))
+            except sqlite3.Error as e:
+                logging.warning(f"Wikipedia cache unavailable: {e}")
+                return None
+            _stores[cache_dir] = store
+        return store
+
+
+def _make_key(kind, key):
+    return f"{hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()}:{kind}"
+
+
+def get(kind, key, config):
+    """
+    Return the cached value of the given kind for key, or None on a miss.
+    """
+    store = _get_store(config)
+    if store is None:
+        return None
+    try:
+        data = store.get(_make_key(kind, key))
+        return json_loads(data) if data is not None else None
+    except (sqlite3.Error, ValueError) as e:
+        logging.warning(f"Failed to read Wikipedia cache: {e}")
+        return None
+
+
+def put(kind, key, value, config):
+    """
+    Store a JSON-serializable value of the given kind for key.
+    """
+    put_many(kind, {key: value}, config)
+
+
+def put_many(kind, values, config):
+    """
+    Store several {key: value} pairs of the given kind in one transaction.
+    """
+    store = _get_store(config)
+    if store is None or not values:
+        return
+    try:
+        store.put_many([(_make_key(kind, key), kind, json_dumps_bytes(value)) for key, value in values.items()])
+    except (sqlite3.Error, TypeError) as e:
+        logging.warning(f"Failed to write Wikipedia cache: {e}")
@@ -18,11 +18,19 @@ import xml.etree.ElementTree as ET
 from entityextractor.config.settings import DEFAULT_CONFIG, get_config
 from entityextractor.services.wikipedia_service import get_wikipedia_title_in_language
 from entityextractor.utils.cache_utils import get_cache_path, load_cache, save_cache
-from entityextractor.utils.rate_limiter import RateLimiter
+from entityextractor.utils.rate_limiter import RateLimiter, AdaptiveConcurrencyLimiter
 
 _config = get_config()
 _rate_limiter = RateLimiter(_config["RATE_LIMIT_MAX_CALLS"], _config["RATE_LIMIT_PERIOD"], _config["RATE_LIMIT_BACKOFF_BASE"], _config["RATE_LIMIT_BACKOFF_MAX"])
+_concurrency_limiter = AdaptiveConcurrencyLimiter(
+    _config.get("DBPEDIA_CONCURRENCY", 4),
+    increase=_config.get("ADAPTIVE_CONCURRENCY_INCREASE", 0.5),
+    decrease=_config.get("ADAPTIVE_CONCURRENCY_DECREASE", 0.5),
+    backoff_base=_config["RATE_LIMIT_BACKOFF_BASE"],
+    backoff_max=_config["RATE_LIMIT_BACKOFF_MAX"]
+)
 
+@_concurrency_limiter
 @_rate_limiter
 def _limited_get(url, **kwargs):
     return requests.get(url, **kwargs)
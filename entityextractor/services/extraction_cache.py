@@ -0,0 +1,71 @@
+"""
+Extraction cache module for the Entity Extractor.
+
+This module stores parsed LLM extraction results on disk, keyed by the model,
+the prompt version and the exact request content, so that repeated runs on
+the same input skip the API call.
+"""
+
+import hashlib
+import logging
+import os
+
+from entityextractor.prompts.extract_prompts import PROMPT_VERSION
+from entityextractor.utils.cache_utils import get_cache_path, load_cache, save_cache
+
+
+def is_enabled(config):
+    """
+    Check whether the extraction cache is enabled in the configuration.
+    """
+    return bool(config.get("CACHE_ENABLED") and config.get("CACHE_OPENAI_ENABLED", True))
+
+
+def make_key(model, messages):
+    """
+    Compute the cache key for an extraction request.
+
+    Args:
+        model: The LLM model name
+        messages: The chat messages sent to the model
+
+    Returns:
+        Hex digest identifying the request
+    """
+    parts = [model.encode("utf-8"), PROMPT_VERSION.encode("utf-8")]
+    parts.extend(m["content"].encode("utf-8") for m in messages)
+    return hashlib.sha256(b"|".join(parts)).hexdigest()
+
+
+def _cache_path(key, config):
+    return get_cache_path(config.get("CACHE_DIR", "cache"), "openai_extract", key)
+
+
+def get(key, config):
+    """
+    Return the cached entity list for key, or None on a miss.
+
+    Entries that no longer satisfy the entity schema (every entity needs a
+    name and a type) are evicted.
+    """
+    cache_path = _cache_path(key, config)
+    entities = load_cache(cache_path)
+    if entities is None:
+        return None
+    if not isinstance(entities, list) or not all(
+        isinstance(ent, dict) and ent.get("name") and ent.get("type") for ent in entities
+    ):
+        logging.warning(f"Evicting invalid extraction cache entry {cache_path}")
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+        return None
+    return entities
+
+
+def put(key, entities, config):
+    """
+    Store the entity list for key.
+    """
+    save_cache(_cache_path(key, config), entities)
@@ -5,57 +5,141 @@ This module provides functions for interacting with the OpenAI API
 to extract entities from text.
 """
 
-import json
+import asyncio
+import functools
 import logging
 import os
+import re
+import tempfile
 import time
-from openai import OpenAI
+import weakref
+
+import backoff
+import httpx
+from openai import OpenAI, AsyncOpenAI, RateLimitError, APIConnectionError, APITimeoutError
 
 from entityextractor.config.settings import DEFAULT_CONFIG
+from entityextractor.services import extraction_cache, semantic_cache
 from entityextractor.utils.text_utils import clean_json_from_markdown
+from entityextractor.utils.json_utils import json_dumps, json_loads
+from entityextractor.utils.jsonl_writer import get_jsonl_writer
+from entityextractor.utils.token_utils import count_tokens, count_tokens_cached, context_window
+from entityextractor.utils.rate_limiter import RateLimitedDispatcher
 from entityextractor.prompts.extract_prompts import (
     get_system_prompt_en, get_system_prompt_de,
     USER_PROMPT_EN, USER_PROMPT_DE,
+    MULTI_TEXT_PROMPT_EN, MULTI_TEXT_PROMPT_DE, MULTI_TEXT_SECTION,
     TYPE_RESTRICTION_TEMPLATE_EN, TYPE_RESTRICTION_TEMPLATE_DE
 )
 from entityextractor.utils.prompt_utils import apply_type_restrictions
 from entityextractor.prompts.compendium_prompts import get_educational_block_de, get_educational_block_en
 
-def extract_entities_with_openai(text, config=None):
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+@functools.lru_cache(maxsize=4)
+def get_openai_client(api_key, base_url):
     """
-    Extract entities from text using OpenAI's API.
+    Return a shared OpenAI client for the given API key and base URL.
+
+    The client keeps its HTTP connection pool alive between calls, so repeated
+    requests reuse established TLS connections.
+    """
+    http_client = httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        timeout=60,
+        http2=_HTTP2_AVAILABLE
+    )
+    return OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+
+# Nur Modelle mit JSON-Mode erlauben response_format
+_JSON_MODE_MODELS = frozenset({
+    "gpt-3.5-turbo-1106", "gpt-3.5-turbo-0125", "gpt-4-1106-preview", "gpt-4-turbo-preview", "gpt-4-0125-preview", "gpt-4o", "gpt-4o-2024-05-13"
+})
+
+# Feste Request-Parameter, pro Aufruf per copy() übernommen
+_REQUEST_DEFAULTS = {"stream": True, "stop": None, "timeout": 60}
+
+def _resolve_api_key(config):
+    api_key = config.get("OPENAI_API_KEY")
+    if not api_key:
+        api_key = os.environ.get("OPENAI_API_KEY")
+    return api_key
+
+@functools.lru_cache(maxsize=32)
+def _build_system_prompt(language, max_entities, allowed_entity_types, educational_mode):
+    """
+    Build the extraction system prompt; memoized because it only depends on config.
+    """
+    system_prompt = get_system_prompt_en(max_entities) if language == "en" else get_system_prompt_de(max_entities)
+    system_prompt = apply_type_restrictions(system_prompt, allowed_entity_types, language)
     
+    # Bildungsmodus: Zusätzliche Strukturierungsaspekte für Bildungswissen hinzufügen
+    if educational_mode:
+        edu_block = get_educational_block_de() if language == "de" else get_educational_block_en()
+        system_prompt = f"{system_prompt.strip()}\n\n{edu_block}"
+    return system_prompt
+
+@functools.lru_cache(maxsize=4)
+def _user_prompt_parts(language):
+    """
+    Split the user prompt template into the text before and after {text}.
+    """
+    template = USER_PROMPT_EN if language == "en" else USER_PROMPT_DE
+    prefix, _, suffix = template.partition("{text}")
+    return prefix.replace("{{", "{").replace("}}", "}"), suffix.replace("{{", "{").replace("}}", "}")
+
+# Sicherheitsabstand für Nachrichten-Overhead (Rollen, Trennzeichen) in Tokens
+_PROMPT_TOKEN_MARGIN = 256
+
+def _fit_max_tokens(model, system_prompt, user_msg, max_tokens):
+    """
+    Cap max_tokens to the room left in the model's context window.
+
+    Returns a value <= 0 if the prompt alone does not fit.
+    """
+    prompt_tokens = count_tokens_cached(system_prompt, model) + count_tokens(user_msg, model)
+    return min(max_tokens, context_window(model) - prompt_tokens - _PROMPT_TOKEN_MARGIN)
+
+def _prompt_too_long(openai_kwargs):
+    """
+    Cap max_tokens of a built request to the context window.
+
+    Called after the cache lookup so that cache hits skip tokenization.
+    Returns True (and logs) if the prompt alone does not fit.
+    """
+    messages = openai_kwargs["messages"]
+    openai_kwargs["max_tokens"] = _fit_max_tokens(
+        openai_kwargs["model"], messages[0]["content"], messages[1]["content"], openai_kwargs["max_tokens"]
+    )
+    if openai_kwargs["max_tokens"] <= 0:
+        logging.error(f"Input too long for the context window of model {openai_kwargs['model']}, skipping extraction")
+        return True
+    return False
+
+def _build_request(text, config):
+    """
+    Build the chat completion arguments for an extraction request.
+
     Args:
         text: The text to extract entities from
-        config: Configuration dictionary with API key and model settings
-        
+        config: Configuration dictionary with model and prompt settings
+
     Returns:
-        A list of extracted entities or an empty list if extraction failed
+        Tuple of (openai_kwargs, mode)
     """
-    if config is None:
-        config = DEFAULT_CONFIG
-        
-    api_key = config.get("OPENAI_API_KEY")
-    if not api_key:
-        api_key = os.environ.get("OPENAI_API_KEY")
-        
-    if not api_key:
-        logging.error("No OpenAI API key provided. Set OPENAI_API_KEY in config or environment.")
-        return []
-        
     model = config.get("MODEL", "gpt-4o-mini")
     language = config.get("LANGUAGE", "de")
     max_entities = config.get("MAX_ENTITIES", 10)
     allowed_entity_types = config.get("ALLOWED_ENTITY_TYPES", "auto")
     
     # LLM-Konfigurationsmerkmale
-    base_url = config.get("LLM_BASE_URL", "https://api.openai.com/v1")
     max_tokens = config.get("MAX_TOKENS", 12000)
     temperature = config.get("TEMPERATURE", None)
 
-    # Create the OpenAI client
-    client = OpenAI(api_key=api_key, base_url=base_url)
-    
     # Prüfe den Modus (extract oder generate)
     mode = config.get("MODE", "extract")
     
@@ -65,71 +149,534 @@ def extract_entities_with_openai(text, config=None):
         mode = "extract"
     
     # Build system prompt and user message
-    system_prompt = get_system_prompt_en(max_entities) if language == "en" else get_system_prompt_de(max_entities)
-    system_prompt = apply_type_restrictions(system_prompt, allowed_entity_types, language)
+    system_prompt = _build_system_prompt(
+        language, max_entities, allowed_entity_types,
+        bool(config.get("COMPENDIUM_EDUCATIONAL_MODE", False))
+    )
+    prefix, suffix = _user_prompt_parts(language)
+    user_msg = f"{prefix}{text}{suffix}"
+
+    # Messages for OpenAI request
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_msg}
+    ]
+    # LLM-Request: max_tokens und base_url immer setzen, temperature nur wenn angegeben
+    openai_kwargs = _REQUEST_DEFAULTS.copy()
+    openai_kwargs["model"] = model
+    openai_kwargs["messages"] = messages
+    # Wird nach der Cache-Abfrage von _prompt_too_long an das Kontextfenster angepasst
+    openai_kwargs["max_tokens"] = max_tokens
+    if model in _JSON_MODE_MODELS:
+        openai_kwargs["response_format"] = {"type": "json_object"}
+
+    if temperature is not None:
+        openai_kwargs["temperature"] = temperature
+    return openai_kwargs, mode
+
+# name; type; wikipedia_url; citation – Felder ohne umgebende Leerzeichen, weitere Felder werden ignoriert
+_ENTITY_LINE_RE = re.compile(r"\s*([^;]*?)\s*;\s*([^;]*?)\s*;\s*([^;]*?)\s*;\s*([^;]*?)\s*(?:;.*)?$", re.DOTALL)
+
+def parse_entity_lines(raw_output, inferred_flag):
+    """
+    Parse semicolon-separated entity lines (name; type; wikipedia_url; citation).
+
+    Args:
+        raw_output: The raw LLM response text
+        inferred_flag: Value for the 'inferred' field of every entity
+
+    Returns:
+        A list of entity dicts; lines with fewer than four fields are skipped
+    """
+    processed_entities = []
+    match = _ENTITY_LINE_RE.match
+    for ln in raw_output.splitlines():
+        m = match(ln)
+        if m:
+            name, entity_type, wikipedia_url, citation = m.groups()
+            processed_entities.append({
+                "name": name,
+                "type": entity_type,
+                "wikipedia_url": wikipedia_url,
+                "citation": citation,
+                "inferred": inferred_flag
+            })
+    return processed_entities
+
+def _parse_entities(raw_output, mode):
+    return parse_entity_lines(raw_output, "explicit" if mode == "extract" else "implicit")
+
+class _EntityLineStream:
+    """
+    Incrementally parse streamed completion chunks into entities.
+
+    Every line is parsed as soon as its newline arrives, so entities become
+    available while the model is still generating.
+    """
+    def __init__(self, mode):
+        self.inferred_flag = "explicit" if mode == "extract" else "implicit"
+        self.buf = ""
+        self.parts = []
+        self.entities = []
+
+    def feed(self, chunk):
+        if not chunk.choices:
+            return
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            return
+        self.parts.append(delta)
+        self.buf += delta
+        while "\n" in self.buf:
+            line, self.buf = self.buf.split("\n", 1)
+            self.entities.extend(parse_entity_lines(line, self.inferred_flag))
+
+    def close(self):
+        """
+        Parse the trailing line and return (raw_output, entities).
+        """
+        if self.buf:
+            self.entities.extend(parse_entity_lines(self.buf, self.inferred_flag))
+            self.buf = ""
+        return "".join(self.parts).strip(), self.entities
+
+def _consume_stream(response, mode):
+    stream = _EntityLineStream(mode)
+    for chunk in response:
+        stream.feed(chunk)
+    return stream.close()
+
+async def _consume_stream_async(response, mode):
+    stream = _EntityLineStream(mode)
+    async for chunk in response:
+        stream.feed(chunk)
+    return stream.close()
+
+def _lookup_cache(text, openai_kwargs, config):
+    """
+    Look up cached entities for a request, first by exact key, then semantically.
+
+    Returns:
+        Tuple of (cached entities or None, state to pass to _store_cache)
+    """
+    state = {}
+    if extraction_cache.is_enabled(config):
+        state["key"] = extraction_cache.make_key(openai_kwargs["model"], openai_kwargs["messages"])
+        cached = extraction_cache.get(state["key"], config)
+        if cached is not None:
+            logging.info(f"Loaded {len(cached)} extracted entities from cache")
+            return cached, state
+    if semantic_cache.is_enabled(config):
+        state["scope"] = semantic_cache.make_scope(openai_kwargs["model"], openai_kwargs["messages"][0]["content"])
+        cached, state["vector"] = semantic_cache.lookup(text, state["scope"], config)
+        if cached is not None:
+            logging.info(f"Loaded {len(cached)} extracted entities from semantic cache")
+            return cached, state
+    return None, state
+
+def _store_cache(state, entities, config):
+    if "key" in state:
+        extraction_cache.put(state["key"], entities, config)
+    if "scope" in state:
+        semantic_cache.add(state.get("vector"), state["scope"], entities, config)
+
+_FORMAT_CORRECTION_MSG = (
+    "Your answer could not be parsed. Reply only with one entity per line in the format: "
+    "name; type; wikipedia_url; citation"
+)
+
+# Fehler, nach denen eine Anfrage samt Lesen des Streams wiederholt wird
+# (httpx.TransportError: Verbindungsabbruch während der Stream läuft)
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError, httpx.TransportError)
+
+def _with_retries(func, config):
+    """
+    Wrap a sync or async completion function with exponential backoff.
+
+    Both extraction paths retry the same errors, configured by
+    LLM_MAX_RETRIES, RATE_LIMIT_BACKOFF_BASE and RATE_LIMIT_BACKOFF_MAX.
+    """
+    return backoff.on_exception(
+        backoff.expo,
+        _RETRYABLE_ERRORS,
+        max_tries=config.get("LLM_MAX_RETRIES", 5),
+        factor=config.get("RATE_LIMIT_BACKOFF_BASE", 1),
+        max_value=config.get("RATE_LIMIT_BACKOFF_MAX", 60),
+        jitter=backoff.full_jitter,
+        on_backoff=lambda details: logging.warning(
+            f"OpenAI request failed ({details['exception']!r}), retrying in {details['wait']:.2f}s"
+        )
+    )(func)
+
+def _complete(client, openai_kwargs, mode):
+    response = client.chat.completions.create(**openai_kwargs)
+    return _consume_stream(response, mode)
+
+async def _complete_async(client, openai_kwargs, mode, sem=None, dispatcher=None):
+    if sem is not None:
+        async with sem:
+            return await _complete_async(client, openai_kwargs, mode, dispatcher=dispatcher)
+    if dispatcher is None:
+        response = await client.chat.completions.create(**openai_kwargs)
+        return await _consume_stream_async(response, mode)
+    # OpenAI rechnet max_tokens gegen das TPM-Limit an
+    messages = openai_kwargs["messages"]
+    est_tokens = (count_tokens_cached(messages[0]["content"], openai_kwargs["model"])
+                  + count_tokens(messages[1]["content"], openai_kwargs["model"])
+                  + openai_kwargs["max_tokens"])
+    await dispatcher.acquire(est_tokens)
+    raw_response = await client.chat.completions.with_raw_response.create(**openai_kwargs)
+    dispatcher.update_from_headers(raw_response.headers)
+    return await _consume_stream_async(raw_response.parse(), mode)
+
+def _correction_request(openai_kwargs, raw_output):
+    """
+    Build the re-ask request for an answer that contained no valid entity lines.
+    """
+    logging.warning("OpenAI response contained no valid entity lines, retrying once with format feedback")
+    retry_kwargs = dict(openai_kwargs)
+    retry_kwargs["messages"] = openai_kwargs["messages"] + [
+        {"role": "assistant", "content": raw_output},
+        {"role": "user", "content": _FORMAT_CORRECTION_MSG}
+    ]
+    return retry_kwargs
+
+def extract_entities_with_openai(text, config=None):
+    """
+    Extract entities from text using OpenAI's API.
     
-    # Bildungsmodus: Zusätzliche Strukturierungsaspekte für Bildungswissen hinzufügen
-    if config.get("COMPENDIUM_EDUCATIONAL_MODE", False):
-        edu_block = get_educational_block_de() if language == "de" else get_educational_block_en()
-        system_prompt = f"{system_prompt.strip()}\n\n{edu_block}"
+    Args:
+        text: The text to extract entities from
+        config: Configuration dictionary with API key and model settings
+        
+    Returns:
+        A list of extracted entities or an empty list if extraction failed
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+        
+    api_key = _resolve_api_key(config)
+    if not api_key:
+        logging.error("No OpenAI API key provided. Set OPENAI_API_KEY in config or environment.")
+        return []
+        
+    base_url = config.get("LLM_BASE_URL", "https://api.openai.com/v1")
+
+    # Reuse the shared OpenAI client
+    client = get_openai_client(api_key, base_url)
     
-    user_msg = USER_PROMPT_EN.format(text=text) if language == "en" else USER_PROMPT_DE.format(text=text)
+    openai_kwargs, mode = _build_request(text, config)
+
+    # === Extraction result caching ===
+    cached, cache_state = _lookup_cache(text, openai_kwargs, config)
+    if cached is not None:
+        return cached
+    if _prompt_too_long(openai_kwargs):
+        return []
 
     try:
         start_time = time.time()
-        logging.info(f"Extracting entities with OpenAI model {model}...")
+        logging.info(f"Extracting entities with OpenAI model {openai_kwargs['model']}...")
+        complete = _with_retries(_complete, config)
         
-        # Messages for OpenAI request
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_msg}
-        ]
-        # LLM-Request: max_tokens und base_url immer setzen, temperature nur wenn angegeben
-        # Nur Modelle mit JSON-Mode erlauben response_format
-        json_mode_models = [
-            "gpt-3.5-turbo-1106", "gpt-3.5-turbo-0125", "gpt-4-1106-preview", "gpt-4-turbo-preview", "gpt-4-0125-preview", "gpt-4o", "gpt-4o-2024-05-13"
+        # Parse semicolon-separated entity lines while the response streams in
+        raw_output, processed_entities = complete(client, openai_kwargs, mode)
+        if raw_output and not processed_entities:
+            # Antwort nicht im erwarteten Format: einmal mit Korrekturhinweis nachfragen
+            raw_output, processed_entities = complete(client, _correction_request(openai_kwargs, raw_output), mode)
+        elapsed_time = time.time() - start_time
+        logging.info(f"Extracted {len(processed_entities)} entities in {elapsed_time:.2f} seconds")
+        if processed_entities:
+            _store_cache(cache_state, processed_entities, config)
+        # Save training data if enabled
+        if config.get("COLLECT_TRAINING_DATA", False):
+            save_training_data(text, processed_entities, config)
+        return processed_entities
+    except Exception as e:
+        logging.error(f"Error calling OpenAI API: {e}")
+        return []
+
+_MULTI_TEXT_HEADER_RE = re.compile(r"^\s*#{2,}\s*Text\s+(\d+)\s*:?\s*$", re.IGNORECASE | re.MULTILINE)
+
+def _split_multi_text_output(raw_output):
+    """
+    Split a multi-text answer into {text_number: section_text}.
+    """
+    sections = {}
+    matches = list(_MULTI_TEXT_HEADER_RE.finditer(raw_output))
+    for m, nxt in zip(matches, matches[1:] + [None]):
+        end = nxt.start() if nxt is not None else len(raw_output)
+        sections[int(m.group(1))] = raw_output[m.end():end]
+    return sections
+
+def extract_entities_multi(texts, config=None):
+    """
+    Extract entities from several short texts with a single chat completion.
+
+    The texts share one system prompt and one request. The answer is split
+    per "### Text N" header. Texts whose section is missing, or every text
+    if the request fails, fall back to extract_entities_with_openai.
+    Batches with more than MAX_TEXTS_PER_REQUEST texts or more than
+    MAX_CHARS_PER_MULTI_REQUEST characters are processed per text.
+    
+    Args:
+        texts: List of texts to extract entities from
+        config: Configuration dictionary with API key and model settings
+        
+    Returns:
+        A list with one entity list per input text, in input order
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+    if (len(texts) < 2
+            or len(texts) > config.get("MAX_TEXTS_PER_REQUEST", 8)
+            or sum(len(t) for t in texts) > config.get("MAX_CHARS_PER_MULTI_REQUEST", 24000)):
+        return [extract_entities_with_openai(text, config) for text in texts]
+
+    api_key = _resolve_api_key(config)
+    if not api_key:
+        logging.error("No OpenAI API key provided. Set OPENAI_API_KEY in config or environment.")
+        return [[] for _ in texts]
+    client = get_openai_client(api_key, config.get("LLM_BASE_URL", "https://api.openai.com/v1"))
+
+    results = [None] * len(texts)
+    pending = []
+    for i, text in enumerate(texts):
+        openai_kwargs, mode = _build_request(text, config)
+        cached, cache_state = _lookup_cache(text, openai_kwargs, config)
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending.append((i, cache_state))
+
+    if len(pending) > 1:
+        language = config.get("LANGUAGE", "de")
+        template = MULTI_TEXT_PROMPT_EN if language == "en" else MULTI_TEXT_PROMPT_DE
+        sections = "\n\n".join(
+            MULTI_TEXT_SECTION.format(index=n, text=texts[i]) for n, (i, _) in enumerate(pending, 1)
+        )
+        multi_kwargs = dict(openai_kwargs)
+        multi_kwargs["messages"] = [
+            openai_kwargs["messages"][0],
+            {"role": "user", "content": template.format(sections=sections)}
         ]
-        openai_kwargs = dict(
-            model=model,
-            messages=messages,
-            stream=False,
-            stop=None,
-            timeout=60,
-            max_tokens=max_tokens
+        multi_kwargs["max_tokens"] = _fit_max_tokens(
+            multi_kwargs["model"], multi_kwargs["messages"][0]["content"],
+            multi_kwargs["messages"][1]["content"], config.get("MAX_TOKENS", 12000)
         )
-        if model in json_mode_models:
-            openai_kwargs["response_format"] = {"type": "json_object"}
+        try:
+            start_time = time.time()
+            logging.info(f"Extracting entities for {len(pending)} texts in one request with OpenAI model {multi_kwargs['model']}...")
+            raw_output, _ = _with_retries(_complete, config)(client, multi_kwargs, mode)
+            answers = _split_multi_text_output(raw_output)
+            for n, (i, cache_state) in enumerate(pending, 1):
+                if n not in answers:
+                    continue
+                processed_entities = _parse_entities(answers[n], mode)
+                results[i] = processed_entities
+                if processed_entities:
+                    _store_cache(cache_state, processed_entities, config)
+                if config.get("COLLECT_TRAINING_DATA", False):
+                    save_training_data(texts[i], processed_entities, config)
+            elapsed_time = time.time() - start_time
+            logging.info(f"Extracted entities for {len(answers)} of {len(pending)} texts in {elapsed_time:.2f} seconds")
+        except Exception as e:
+            logging.warning(f"Multi-text extraction failed, falling back to single requests: {e}")
 
-        if temperature is not None:
-            openai_kwargs["temperature"] = temperature
-        response = client.chat.completions.create(**openai_kwargs)
+    # Fallback: fehlende Abschnitte einzeln extrahieren
+    for i, result in enumerate(results):
+        if result is None:
+            results[i] = extract_entities_with_openai(texts[i], config)
+    return results
+
+# One AsyncOpenAI client per event loop and (api_key, base_url); the pooled
+# connections of an httpx.AsyncClient are bound to the loop that created them.
+_async_clients = weakref.WeakKeyDictionary()
+
+def _get_async_client(api_key, base_url, config):
+    loop = asyncio.get_running_loop()
+    clients = _async_clients.setdefault(loop, {})
+    client = clients.get((api_key, base_url))
+    if client is None:
+        limits = httpx.Limits(max_connections=config.get("LLM_MAX_CONCURRENCY", 16))
+        client = AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=httpx.AsyncClient(limits=limits))
+        clients[(api_key, base_url)] = client
+    return client
+
+async def extract_entities_with_openai_async(text, config=None, client=None, sem=None, dispatcher=None):
+    """
+    Extract entities from text using OpenAI's API without blocking the event loop.
+    
+    Args:
+        text: The text to extract entities from
+        config: Configuration dictionary with API key and model settings
+        client: Optional AsyncOpenAI client (defaults to a shared client per event loop)
+        sem: Optional asyncio.Semaphore bounding the number of concurrent requests
+        dispatcher: Optional RateLimitedDispatcher enforcing request/token-per-minute limits
         
-        # Parse semicolon-separated entity lines
-        raw_output = response.choices[0].message.content.strip()
-        lines = raw_output.splitlines()
-        processed_entities = []
-        for ln in lines:
-            parts = [p.strip() for p in ln.split(";")]
-            if len(parts) >= 4:
-                name, typ, url, citation = parts[:4]
-                inferred_flag = "explicit" if mode == "extract" else "implicit"
-                processed_entities.append({
-                    "name": name,
-                    "type": typ,
-                    "wikipedia_url": url,
-                    "citation": citation,
-                    "inferred": inferred_flag
-                })
+    Returns:
+        A list of extracted entities or an empty list if extraction failed
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    if client is None:
+        api_key = _resolve_api_key(config)
+        if not api_key:
+            logging.error("No OpenAI API key provided. Set OPENAI_API_KEY in config or environment.")
+            return []
+        base_url = config.get("LLM_BASE_URL", "https://api.openai.com/v1")
+        client = _get_async_client(api_key, base_url, config)
+
+    openai_kwargs, mode = _build_request(text, config)
+
+    # === Extraction result caching ===
+    cached, cache_state = _lookup_cache(text, openai_kwargs, config)
+    if cached is not None:
+        return cached
+    if _prompt_too_long(openai_kwargs):
+        return []
+
+    try:
+        start_time = time.time()
+        logging.info(f"Extracting entities with OpenAI model {openai_kwargs['model']}...")
+        complete = _with_retries(_complete_async, config)
+        raw_output, processed_entities = await complete(client, openai_kwargs, mode, sem, dispatcher)
+        if raw_output and not processed_entities:
+            # Antwort nicht im erwarteten Format: einmal mit Korrekturhinweis nachfragen
+            raw_output, processed_entities = await complete(
+                client, _correction_request(openai_kwargs, raw_output), mode, sem, dispatcher
+            )
+
         elapsed_time = time.time() - start_time
         logging.info(f"Extracted {len(processed_entities)} entities in {elapsed_time:.2f} seconds")
-        # Save training data if enabled
+        if processed_entities:
+            _store_cache(cache_state, processed_entities, config)
         if config.get("COLLECT_TRAINING_DATA", False):
-            save_training_data(text, processed_entities, config)
+            # Dateizugriff im Worker-Thread, damit die Event-Loop frei bleibt
+            await asyncio.to_thread(save_training_data, text, processed_entities, config)
         return processed_entities
     except Exception as e:
         logging.error(f"Error calling OpenAI API: {e}")
         return []
 
+async def extract_entities_batch(texts, config=None):
+    """
+    Extract entities from several texts concurrently.
+
+    At most LLM_MAX_ASYNC requests are in flight at the same time, and
+    LLM_RPM / LLM_TPM (if set) are enforced by a token-bucket dispatcher.
+    With USE_BATCH_API the texts are sent through the OpenAI Batch API instead.
+    
+    Args:
+        texts: List of texts to extract entities from
+        config: Configuration dictionary with API key and model settings
+        
+    Returns:
+        A list with one entity list per input text, in input order
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+    if config.get("USE_BATCH_API", False):
+        return await asyncio.to_thread(extract_entities_batch_api, texts, config)
+    sem = asyncio.Semaphore(config.get("LLM_MAX_ASYNC", 16))
+    dispatcher = None
+    if config.get("LLM_RPM") or config.get("LLM_TPM"):
+        dispatcher = RateLimitedDispatcher(config.get("LLM_RPM"), config.get("LLM_TPM"))
+
+    async def bounded(text):
+        return await extract_entities_with_openai_async(text, config, sem=sem, dispatcher=dispatcher)
+
+    return await asyncio.gather(*[bounded(t) for t in texts])
+
+def extract_entities_batch_api(texts, config=None):
+    """
+    Extract entities from several texts via the OpenAI Batch API.
+
+    Intended for offline bulk jobs: the requests are uploaded as one JSONL file,
+    processed within the 24h completion window at reduced cost and with a
+    separate rate limit pool, and the results are polled for.
+    
+    Args:
+        texts: List of texts to extract entities from
+        config: Configuration dictionary with API key and model settings
+        
+    Returns:
+        A list with one entity list per input text, in input order
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    api_key = _resolve_api_key(config)
+    if not api_key:
+        logging.error("No OpenAI API key provided. Set OPENAI_API_KEY in config or environment.")
+        return [[] for _ in texts]
+    client = get_openai_client(api_key, config.get("LLM_BASE_URL", "https://api.openai.com/v1"))
+
+    results = [[] for _ in texts]
+    pending = {}
+    for i, text in enumerate(texts):
+        openai_kwargs, mode = _build_request(text, config)
+        cached, cache_state = _lookup_cache(text, openai_kwargs, config)
+        if cached is not None:
+            results[i] = cached
+        elif not _prompt_too_long(openai_kwargs):
+            pending[f"text-{i}"] = (i, openai_kwargs, mode, cache_state)
+    if not pending:
+        return results
+
+    try:
+        start_time = time.time()
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl", encoding="utf-8", delete=False) as f:
+            batch_path = f.name
+            for custom_id, (_, openai_kwargs, _, _) in pending.items():
+                # stream/stop/timeout are client options, not part of the request body
+                body = {k: v for k, v in openai_kwargs.items() if k not in ("stream", "stop", "timeout")}
+                f.write(json_dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body}) + "\n")
+        try:
+            with open(batch_path, "rb") as f:
+                batch_file = client.files.create(file=f, purpose="batch")
+        finally:
+            os.remove(batch_path)
+        batch = client.batches.create(input_file_id=batch_file.id, endpoint="/v1/chat/completions", completion_window="24h")
+        logging.info(f"Submitted OpenAI batch {batch.id} with {len(pending)} requests")
+
+        # Poll with exponential backoff until the batch reaches a terminal state
+        delay = config.get("BATCH_API_POLL_MIN", 5)
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(delay)
+            delay = min(delay * 2, config.get("BATCH_API_POLL_MAX", 300))
+            batch = client.batches.retrieve(batch.id)
+            logging.info(f"OpenAI batch {batch.id} status: {batch.status}")
+        if batch.status != "completed" or not batch.output_file_id:
+            logging.error(f"OpenAI batch {batch.id} finished with status {batch.status}")
+            return results
+
+        output = client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            item = json_loads(line)
+            entry = pending.get(item.get("custom_id"))
+            response = item.get("response") or {}
+            if entry is None or response.get("status_code") != 200:
+                logging.warning(f"Batch request {item.get('custom_id')} failed: {item.get('error')}")
+                continue
+            i, _, mode, cache_state = entry
+            raw_output = response["body"]["choices"][0]["message"]["content"].strip()
+            processed_entities = _parse_entities(raw_output, mode)
+            results[i] = processed_entities
+            if processed_entities:
+                _store_cache(cache_state, processed_entities, config)
+            if config.get("COLLECT_TRAINING_DATA", False):
+                save_training_data(texts[i], processed_entities, config)
+        elapsed_time = time.time() - start_time
+        logging.info(f"Extracted entities for {len(pending)} texts via Batch API in {elapsed_time:.2f} seconds")
+        return results
+    except Exception as e:
+        logging.error(f"Error calling OpenAI Batch API: {e}")
+        return results
+
 def save_training_data(text, entities, config=None):
     """
     Save training data for future fine-tuning.
@@ -169,8 +716,7 @@ def save_training_data(text, entities, config=None):
         
         # Speichere nur im OpenAI-Format
         training_data_path = config.get("OPENAI_TRAINING_DATA_PATH", "entity_extractor_openai_format.jsonl")  # Path to JSONL file for training data
-        with open(training_data_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(example, ensure_ascii=False) + "\n")
+        get_jsonl_writer(training_data_path).write(example)
             
         logging.info(f"Saved training example to {training_data_path}")
     except Exception as e:
@@ -202,8 +748,7 @@ def save_relationship_training_data(system_prompt, user_prompt, relationships, c
                 {"role": "assistant", "content": assistant_content}
             ]
         }
-        with open(training_data_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(example, ensure_ascii=False) + "\n")
+        get_jsonl_writer(training_data_path).write(example)
         logging.info(f"Saved relationship training example to {training_data_path}")
     except Exception as e:
         logging.error(f"Error saving relationship training data: {e}")
@@ -0,0 +1,213 @@
+"""
+Semantic cache module for the Entity Extractor.
+
+This module reuses extraction results for near-duplicate input texts. Texts
+are embedded with a local embedding model and compared by cosine similarity
+against previously extracted texts; a sufficiently similar match returns the
+stored entities instead of calling the LLM.
+
+Requires numpy and either sentence-transformers or fastembed. Without them
+the cache stays disabled.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_lock = threading.Lock()
+_caches = {}
+
+
+def is_enabled(config):
+    """
+    Check whether the semantic cache is enabled in the configuration.
+    """
+    return bool(config.get("CACHE_ENABLED") and config.get("CACHE_SEMANTIC_ENABLED", False))
+
+
+def make_scope(model, system_prompt):
+    """
+    Compute the scope under which cached results are comparable.
+
+    Results are only reused for the same model and system prompt.
+    """
+    return hashlib.sha256(f"{model}|{system_prompt}".encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=2)
+def _load_encoder(model_name):
+    """
+    Load a local embedding model, returning a callable text -> vector or None.
+
+    Failures (missing packages, model download errors) are logged once and
+    cached as None, so the cache stays disabled instead of retrying per call.
+    """
+    if np is None:
+        logging.warning("Semantic cache disabled: numpy is not installed")
+        return None
+    try:
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            pass
+        else:
+            model = SentenceTransformer(model_name)
+            return lambda text: np.asarray(model.encode(text), dtype=np.float32)
+        try:
+            from fastembed import TextEmbedding
+        except ImportError:
+            logging.warning("Semantic cache disabled: neither sentence-transformers nor fastembed is installed")
+            return None
+        model = TextEmbedding(model_name)
+        return lambda text: np.asarray(next(iter(model.embed([text]))), dtype=np.float32)
+    except Exception as e:
+        logging.warning(f"Semantic cache disabled: failed to load embedding model {model_name}: {e}")
+        return None
+
+
+class SemanticCache:
+    """
+    Embedding index of extracted texts for one scope.
+
+    Vectors are appended as raw float32 rows to a .f32 file and entities as
+    lines to a .jsonl file, so adding an entry writes only that entry. In
+    memory the vectors live in a buffer that doubles its capacity when full.
+    """
+    def __init__(self, directory, scope, dim):
+        os.makedirs(directory, exist_ok=True)
+        self.dim = dim
+        self.vectors_path = os.path.join(directory, f"{scope}.f32")
+        self.entries_path = os.path.join(directory, f"{scope}.jsonl")
+        self.legacy_path = os.path.join(directory, f"{scope}.npz")
+        self.buffer = np.empty((16, dim), dtype=np.float32)
+        self.size = 0
+        self.entries = []
+        self._load()
+
+    def _load(self):
+        try:
+            if os.path.exists(self.vectors_path):
+                matrix = np.fromfile(self.vectors_path, dtype=np.float32)
+            elif os.path.exists(self.legacy_path):
+                # Älteres Format: komplette Matrix als .npz
+                matrix = np.load(self.legacy_path)["vectors"].astype(np.float32).ravel()
+            else:
+                return
+            matrix = matrix[:matrix.size // self.dim * self.dim].reshape(-1, self.dim)
+            with open(self.entries_path, "r", encoding="utf-8") as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logging.warning(f"Failed to load semantic cache {self.vectors_path}: {e}")
+            return
+        size = min(len(matrix), len(entries))
+        self._reserve(size)
+        self.buffer[:size] = matrix[:size]
+        self.size = size
+        self.entries = entries[:size]
+        if len(matrix) != size or len(entries) != size or not os.path.exists(self.vectors_path):
+            # Nach einem Abbruch oder beim Umstieg vom .npz-Format beide Dateien auf denselben Stand bringen,
+            # damit spätere Anhänge wieder zeilengleich sind
+            try:
+                self.buffer[:size].tofile(self.vectors_path)
+                with open(self.entries_path, "w", encoding="utf-8") as f:
+                    f.writelines(json.dumps(e, ensure_ascii=False) + "\n" for e in self.entries)
+                if os.path.exists(self.legacy_path):
+                    os.remove(self.legacy_path)
+            except OSError as e:
+                logging.warning(f"Failed to rewrite semantic cache {self.vectors_path}: {e}")
+
+    def _reserve(self, size):
+        if size > len(self.buffer):
+            capacity = len(self.buffer)
+            while capacity < size:
+                capacity *= 2
+            buffer = np.empty((capacity, self.dim), dtype=np.float32)
+            buffer[:self.size] = self.buffer[:self.size]
+            self.buffer = buffer
+
+    def lookup(self, vector, threshold):
+        """
+        Return the entities of the most similar cached text above threshold, or None.
+        """
+        if not self.size:
+            return None
+        sims = self.buffer[:self.size] @ vector
+        best = int(sims.argmax())
+        if sims[best] > threshold:
+            return self.entries[best]
+        return None
+
+    def add(self, vector, entities):
+        """
+        Add a normalized vector and its entities and append both to disk.
+        """
+        self._reserve(self.size + 1)
+        self.buffer[self.size] = vector
+        self.size += 1
+        self.entries.append(entities)
+        try:
+            with open(self.vectors_path, "ab") as f:
+                f.write(np.asarray(vector, dtype=np.float32).tobytes())
+            with open(self.entries_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entities, ensure_ascii=False) + "\n")
+        except Exception as e:
+            logging.warning(f"Failed to save semantic cache {self.vectors_path}: {e}")
+
+
+def _embed(text, config):
+    encoder = _load_encoder(config.get("CACHE_SEMANTIC_MODEL", "sentence-transformers/all-MiniLM-L6-v2"))
+    if encoder is None:
+        return None
+    try:
+        v = encoder(text)
+    except Exception as e:
+        logging.warning(f"Failed to embed text for the semantic cache: {e}")
+        return None
+    norm = np.linalg.norm(v)
+    if not norm:
+        return None
+    return v / norm
+
+
+def _get_cache(scope, dim, config):
+    directory = os.path.join(config.get("CACHE_DIR", "cache"), "semantic")
+    key = (directory, scope, dim)
+    cache = _caches.get(key)
+    if cache is None:
+        cache = _caches[key] = SemanticCache(directory, scope, dim)
+    return cache
+
+
+def lookup(text, scope, config):
+    """
+    Return cached entities for a text similar to text within scope, or None.
+
+    Returns:
+        Tuple of (entities or None, embedding vector or None)
+    """
+    v = _embed(text, config)
+    if v is None:
+        return None, None
+    with _lock:
+        entities = _get_cache(scope, len(v), config).lookup(v, config.get("CACHE_SEMANTIC_THRESHOLD", 0.95))
+    return entities, v
+
+
+def add(vector, scope, entities, config):
+    """
+    Store entities under the embedding vector returned by lookup.
+    """
+    if vector is None:
+        return
+    with _lock:
+        _get_cache(scope, len(vector), config).add(vector, entities)
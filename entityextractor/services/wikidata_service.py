@@ -5,22 +5,64 @@ This module provides functions for interacting with the Wikidata API
 and extracting information from Wikidata entities.
 """
 
+import atexit
 import logging
-import requests
 import hashlib
-import json
 import os
-from openai import OpenAI
+import pickle
+import queue
+import re
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
 from entityextractor.config.settings import get_config, DEFAULT_CONFIG
-from entityextractor.utils.text_utils import clean_json_from_markdown
-from entityextractor.utils.rate_limiter import RateLimiter
+from entityextractor.utils.json_utils import json_loads, json_loads_llm, json_dumps_bytes
+from entityextractor.utils.rate_limiter import PerHostRateLimiter, AdaptiveConcurrencyLimiter
+from entityextractor.utils.http_utils import create_session
+from entityextractor.utils.singleflight import SingleFlight
+from entityextractor.utils.cache_utils import get_cache_path, load_cache
+from entityextractor.services.openai_service import get_openai_client
+from entityextractor.services import _wikidata_label_cache as label_cache
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
 
 _config = get_config()
-_rate_limiter = RateLimiter(_config["RATE_LIMIT_MAX_CALLS"], _config["RATE_LIMIT_PERIOD"], _config["RATE_LIMIT_BACKOFF_BASE"], _config["RATE_LIMIT_BACKOFF_MAX"])
+_rate_limiter = PerHostRateLimiter(
+    _config["RATE_LIMIT_MAX_CALLS"], _config["RATE_LIMIT_PERIOD"], _config["RATE_LIMIT_BACKOFF_BASE"], _config["RATE_LIMIT_BACKOFF_MAX"],
+    host_max_calls=_config.get("RATE_LIMIT_HOST_MAX_CALLS"),
+    retry_on_429=False  # 429/5xx werden von der Session (urllib3 Retry) wiederholt
+)
+
+_concurrency_limiter = AdaptiveConcurrencyLimiter(
+    _config.get("WIKIDATA_CONCURRENCY", 8),
+    increase=_config.get("ADAPTIVE_CONCURRENCY_INCREASE", 0.5),
+    decrease=_config.get("ADAPTIVE_CONCURRENCY_DECREASE", 0.5),
+    backoff_base=_config["RATE_LIMIT_BACKOFF_BASE"],
+    backoff_max=_config["RATE_LIMIT_BACKOFF_MAX"]
+)
+_session = create_session(_config)
+_description_flight = SingleFlight()
 
+@_concurrency_limiter
 @_rate_limiter
 def _limited_get(url, **kwargs):
-    return requests.get(url, **kwargs)
+    return _session.get(url, **kwargs)
+
+@_concurrency_limiter
+@_rate_limiter
+def _limited_post(url, **kwargs):
+    return _session.post(url, **kwargs)
+
+# Thread-Pool für unabhängige Wikidata-Anfragen; _limited_get bleibt die Drosselstelle
+_executor = ThreadPoolExecutor(max_workers=_config.get("WIKIDATA_CONCURRENCY", 8), thread_name_prefix="wikidata")
 
 def search_wikidata_by_entity_name(entity_name, language="en", config=None, try_english=True):
     """
@@ -53,24 +95,24 @@ def search_wikidata_by_entity_name(entity_name, language="en", config=None, try_
     try:
         response = _limited_get(api_url, params=params, headers={"User-Agent": config.get("USER_AGENT")}, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
         
         # Check if we got any search results
         search_results = data.get("search", [])
         if search_results:
             # Return the ID of the first (most relevant) result
             wikidata_id = search_results[0].get("id")
-            logging.info(f"Wikidata search found ID {wikidata_id} for entity '{entity_name}' in {language}")
+            logging.info("Wikidata search found ID %s for entity '%s' in %s", wikidata_id, entity_name, language)
             return wikidata_id
         else:
-            logging.warning(f"No Wikidata entities found for '{entity_name}' in {language}")
+            logging.warning("No Wikidata entities found for '%s' in %s", entity_name, language)
             
             # If language is not English and try_english is True, try searching in English
             if language != "en" and try_english:
                 # Try to translate the term to English using LLM for better results
                 english_term = translate_to_english(entity_name, config)
                 if english_term and english_term != entity_name:
-                    logging.info(f"Trying Wikidata search with English translation: '{english_term}'")
+                    logging.info("Trying Wikidata search with English translation: '%s'", english_term)
                     return search_wikidata_by_entity_name(english_term, language="en", config=config, try_english=False)
             
             return None
@@ -78,6 +120,37 @@ def search_wikidata_by_entity_name(entity_name, language="en", config=None, try_
         logging.error(f"Error searching Wikidata for '{entity_name}': {e}")
         return None
 
+def _llm_cache_path(namespace, term, lang, config):
+    """
+    Return the cache file for an LLM helper result, or None if LLM caching is disabled.
+    """
+    if not (config.get("CACHE_ENABLED") and config.get("CACHE_LLM_ENABLED", True)):
+        return None
+    model = config.get("MODEL", "gpt-4o-mini")
+    return get_cache_path(config.get("CACHE_DIR", "cache"), namespace, f"{term}|{lang}|{model}")
+
+def _atomic_write_json(path, data):
+    """
+    Write data as JSON to path via a temporary file and os.replace, so readers never see a partial file.
+    """
+    _atomic_write_bytes(path, json_dumps_bytes(data))
+
+def _atomic_write_bytes(path, data):
+    """
+    Write bytes to path via a temporary file and os.replace, so readers never see a partial file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
 def translate_to_english(term, config=None):
     """
     Translate a term to English using OpenAI.
@@ -93,6 +166,13 @@ def translate_to_english(term, config=None):
     if config is None:
         config = DEFAULT_CONFIG
         
+    cache_path = _llm_cache_path("llm_translate", term, "en", config)
+    if cache_path:
+        cached = load_cache(cache_path)
+        if cached is not None:
+            logging.info("Loaded cached English translation for '%s': '%s'", term, cached)
+            return cached
+        
     api_key = config.get("OPENAI_API_KEY")
     if not api_key:
         api_key = os.environ.get("OPENAI_API_KEY")
@@ -104,8 +184,8 @@ def translate_to_english(term, config=None):
     model = config.get("MODEL", "gpt-4o-mini")
     base_url = config.get("LLM_BASE_URL", "https://api.openai.com/v1")
     
-    # Create the OpenAI client
-    client = OpenAI(api_key=api_key, base_url=base_url)
+    # Reuse the shared OpenAI client
+    client = get_openai_client(api_key, base_url)
     
     # German prompt for translation with Wikidata focus
     system_prompt = "Du bist ein Experte für Übersetzungen wissenschaftlicher Begriffe und die Terminologie in Wikidata. Übersetze präzise ins Englische unter Berücksichtigung der in Wikidata verwendeten Fachbegriffe."
@@ -126,7 +206,12 @@ def translate_to_english(term, config=None):
         translation = response.choices[0].message.content.strip()
         translation = translation.strip('"').strip("'").strip()
         
-        logging.info(f"Translated '{term}' to English: '{translation}'")
+        logging.info("Translated '%s' to English: '%s'", term, translation)
+        if cache_path and translation:
+            try:
+                _atomic_write_json(cache_path, translation)
+            except Exception as e:
+                logging.warning("Failed to save translation cache %s: %s", cache_path, e)
         return translation
     except Exception as e:
         logging.error(f"Error translating '{term}' to English: {e}")
@@ -148,6 +233,13 @@ def generate_entity_synonyms(entity_name, language="en", config=None):
     if config is None:
         config = DEFAULT_CONFIG
         
+    cache_path = _llm_cache_path("llm_synonyms", entity_name, language, config)
+    if cache_path:
+        cached = load_cache(cache_path)
+        if cached is not None:
+            logging.info("Loaded %s cached synonyms for '%s': %s", len(cached), entity_name, cached)
+            return cached
+        
     api_key = config.get("OPENAI_API_KEY")
     if not api_key:
         api_key = os.environ.get("OPENAI_API_KEY")
@@ -159,8 +251,8 @@ def generate_entity_synonyms(entity_name, language="en", config=None):
     model = config.get("MODEL", "gpt-4o-mini")
     base_url = config.get("LLM_BASE_URL", "https://api.openai.com/v1")
     
-    # Create the OpenAI client
-    client = OpenAI(api_key=api_key, base_url=base_url)
+    # Reuse the shared OpenAI client
+    client = get_openai_client(api_key, base_url)
     
     # Determine the prompt based on language
     if language == "en":
@@ -184,12 +276,16 @@ def generate_entity_synonyms(entity_name, language="en", config=None):
         # Extract the response content
         raw_json = response.choices[0].message.content.strip()
         
-        # Clean the JSON if it's wrapped in markdown code blocks
-        raw_json = clean_json_from_markdown(raw_json)
-        
-        # Parse the JSON array
-        synonyms = json.loads(raw_json)
-        logging.info(f"Generated {len(synonyms)} synonyms for '{entity_name}': {synonyms}")
+        # Parse the JSON array (Markdown-Codeblöcke und kleine Syntaxfehler werden toleriert)
+        synonyms = json_loads_llm(raw_json)
+        if not isinstance(synonyms, list):
+            synonyms = []
+        logging.info("Generated %s synonyms for '%s': %s", len(synonyms), entity_name, synonyms)
+        if cache_path and synonyms:
+            try:
+                _atomic_write_json(cache_path, synonyms)
+            except Exception as e:
+                logging.warning("Failed to save synonym cache %s: %s", cache_path, e)
         return synonyms
     except Exception as e:
         logging.error(f"Error generating synonyms for '{entity_name}': {e}")
@@ -199,6 +295,12 @@ def get_wikidata_id_from_wikipedia_url(wikipedia_url, entity_name=None, config=N
     """
     Retrieve the Wikidata ID for a Wikipedia article.
     
+    If the article has no linked item, the entity name, (for German) an English
+    translation and LLM-generated synonyms are searched. Translation and synonyms
+    are requested speculatively while the direct search is running. Synonyms are
+    searched concurrently and the first search to return a match wins, so on ties
+    the order of the synonyms no longer decides which ID is returned.
+    
     Args:
         wikipedia_url: URL of the Wikipedia article
         entity_name: Original entity name (for fallback search)
@@ -242,7 +344,7 @@ def get_wikidata_id_from_wikipedia_url(wikipedia_url, entity_name=None, config=N
     try:
         response = _limited_get(api_url, params=params, headers={"User-Agent": config.get("USER_AGENT")}, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
         
         # Normalize and follow redirects to get canonical title
         original_title = title
@@ -254,7 +356,7 @@ def get_wikidata_id_from_wikipedia_url(wikipedia_url, entity_name=None, config=N
         elif redirects:
             new_title = redirects[0].get("to")
         if new_title and new_title != original_title:
-            logging.info(f"Canonical title for Wikidata lookup: {original_title} -> {new_title}")
+            logging.info("Canonical title for Wikidata lookup: %s -> %s", original_title, new_title)
             title = new_title
             # Use canonical name for fallback search
             entity_name = new_title.replace('_', ' ')
@@ -269,35 +371,51 @@ def get_wikidata_id_from_wikipedia_url(wikipedia_url, entity_name=None, config=N
         
         # Try fallback search by entity name if provided
         if entity_name:
-            logging.info(f"Trying fallback Wikidata search for entity: '{entity_name}'")
+            logging.info("Trying fallback Wikidata search for entity: '%s'", entity_name)
             lang = "en" if "en.wikipedia.org" in wikipedia_url else "de"
-            wikidata_id = search_wikidata_by_entity_name(entity_name, language=lang, config=config)
             
-            # If direct search fails, try with LLM-generated synonyms
-            if not wikidata_id:
-                logging.info(f"Direct Wikidata search failed. Trying with LLM-generated synonyms for '{entity_name}'")
-                synonyms = generate_entity_synonyms(entity_name, language=lang, config=config)
+            # Übersetzung und Synonyme spekulativ parallel zur direkten Suche anfordern,
+            # damit sie bei einem Fehlschlag bereits vorliegen
+            synonyms_future = _executor.submit(generate_entity_synonyms, entity_name, language=lang, config=config)
+            translate_future = _executor.submit(translate_to_english, entity_name, config=config) if lang == "de" else None
+            
+            wikidata_id = search_wikidata_by_entity_name(entity_name, language=lang, config=config, try_english=False)
+            if wikidata_id:
+                synonyms_future.cancel()
+                if translate_future:
+                    translate_future.cancel()
+                return wikidata_id
                 
-                # Try each synonym until we find a match
-                for synonym in synonyms:
-                    logging.info(f"Trying Wikidata search with synonym: '{synonym}'")
-                    wikidata_id = search_wikidata_by_entity_name(synonym, language=lang, config=config)
+            # If the German search fails, try the English translation
+            if translate_future:
+                english_term = translate_future.result()
+                if english_term and english_term != entity_name:
+                    logging.info("Trying Wikidata search with English translation: '%s'", english_term)
+                    wikidata_id = search_wikidata_by_entity_name(english_term, language="en", config=config, try_english=False)
                     if wikidata_id:
-                        logging.info(f"Found Wikidata ID {wikidata_id} using synonym '{synonym}'")
+                        synonyms_future.cancel()
+                        logging.info("Found Wikidata ID %s using English translation '%s'", wikidata_id, english_term)
                         return wikidata_id
-                        
-                # If we're using German and all German attempts failed, try English translation
-                if lang == "de":
-                    logging.info(f"All German attempts failed. Trying English translation for '{entity_name}'")
-                    english_term = translate_to_english(entity_name, config=config)
-                    if english_term:
-                        logging.info(f"Trying Wikidata search with English translation: '{english_term}'")
-                        wikidata_id = search_wikidata_by_entity_name(english_term, language="en", config=config)
-                        if wikidata_id:
-                            logging.info(f"Found Wikidata ID {wikidata_id} using English translation '{english_term}'")
-                            return wikidata_id
-                        
-                logging.warning(f"All fallback attempts failed for '{entity_name}'")
+            
+            # If direct search fails, try with LLM-generated synonyms
+            logging.info("Direct Wikidata search failed. Trying with LLM-generated synonyms for '%s'", entity_name)
+            synonyms = synonyms_future.result()
+            
+            # Search all synonyms concurrently and take the first match;
+            # searches that have not started yet are cancelled on success
+            futures = {}
+            for synonym in synonyms:
+                logging.info("Trying Wikidata search with synonym: '%s'", synonym)
+                futures[_executor.submit(search_wikidata_by_entity_name, synonym, language=lang, config=config)] = synonym
+            for future in as_completed(futures):
+                wikidata_id = future.result()
+                if wikidata_id:
+                    for other in futures:
+                        other.cancel()
+                    logging.info("Found Wikidata ID %s using synonym '%s'", wikidata_id, futures[future])
+                    return wikidata_id
+                    
+            logging.warning("All fallback attempts failed for '%s'", entity_name)
             return wikidata_id
         return None
     except Exception as e:
@@ -319,22 +437,450 @@ def get_wikidata_description(qid, lang="de", config=None):
     if config is None:
         config = DEFAULT_CONFIG
         
-    api_url = f"https://www.wikidata.org/wiki/Special:EntityData/{qid}.json"
+    cached = label_cache.get(qid, lang, config)
+    if cached is not label_cache.MISS:
+        return cached
+        
+    # wbgetentities mit props=descriptions statt des vollständigen EntityData-Dokuments;
+    # gleichzeitige Anfragen für dieselbe (qid, lang) teilen sich einen Request
+    return _description_flight.do((qid, lang), _fetch_description_chunk, [qid], lang, config).get(qid)
+
+def _first_datavalue(claim_list):
     try:
-        r = _limited_get(api_url, headers={"User-Agent": config.get("USER_AGENT")}, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
+        return claim_list[0]["mainsnak"]["datavalue"]
+    except (IndexError, KeyError):
+        return None
+
+def _iter_entity_ids(claim_list):
+    """
+    Yield the Q-IDs referenced by a list of claims, skipping claims without a value.
+    """
+    for claim in claim_list:
+        try:
+            dv = claim["mainsnak"]["datavalue"]
+        except KeyError:
+            continue
+        if dv.get("type") == "wikibase-entityid":
+            yield dv["value"]["id"]
+
+def _extract_value(dv):
+    return dv.get("value") or None
+
+def _extract_string(dv):
+    if dv.get("type") == "string":
+        return dv.get("value") or None
+    return None
+
+def _extract_image(dv):
+    image_value = dv.get("value")
+    if not image_value:
+        return None
+    # Convert image name to Wikimedia Commons URL
+    return f"https://commons.wikimedia.org/wiki/Special:FilePath/{image_value.replace(' ', '_')}"
+
+def _extract_coordinates(dv):
+    coord_value = dv.get("value", {})
+    if coord_value and "latitude" in coord_value and "longitude" in coord_value:
+        return {"latitude": coord_value["latitude"], "longitude": coord_value["longitude"]}
+    return None
+
+# Format: +YYYY-MM-DDT00:00:00Z -> YYYY-MM-DD (negative Jahre behalten das Vorzeichen)
+_TIME_RE = re.compile(r"^\+?(-?\d+-\d{2}-\d{2})")
+
+def _fmt_time(time_str):
+    if not time_str:
+        return None
+    match = _TIME_RE.match(time_str)
+    return match.group(1) if match else None
+
+def _extract_time(dv):
+    time_value = dv.get("value") or {}
+    return _fmt_time(time_value.get("time"))
+
+def _extract_monolingual(dv):
+    if dv.get("type") == "monolingualtext":
+        return dv["value"].get("text") or None
+    return None
+
+def _extract_quantity(dv):
+    if dv.get("type") == "quantity":
+        return dv["value"].get("amount")
+    return None
+
+# Mehrwertige Eigenschaften: alle referenzierten Q-IDs werden aufgelöst
+_LIST_PROPS = (
+    ("P31", "instance_of"),     # instance of
+    ("P279", "subclass_of"),    # subclass of
+    ("P106", "occupations"),    # occupation
+    ("P27", "citizenships"),    # country of citizenship
+    ("P361", "part_of"),        # part of
+    ("P527", "has_parts"),      # has part
+    ("P463", "member_of"),      # member of
+)
+
+# Einwertige Eigenschaften mit Q-ID: nur der erste Claim wird aufgelöst
+_ENTITY_PROPS = (
+    ("P19", "birth_place"),     # place of birth
+    ("P20", "death_place"),     # place of death
+)
+
+# Einwertige Literal-Eigenschaften: (Property, Ergebnisschlüssel, Extraktor für den ersten Claim)
+_SIMPLE_PROPS = (
+    ("P18", "image_url", _extract_image),
+    ("P856", "website", _extract_value),
+    ("P625", "coordinates", _extract_coordinates),
+    ("P571", "foundation_date", _extract_time),
+    ("P569", "birth_date", _extract_time),
+    ("P570", "death_date", _extract_time),
+    ("P1448", "official_name", _extract_monolingual),
+    ("P1082", "population", _extract_quantity),
+    ("P227", "gnd_id", _extract_string),
+    ("P213", "isni", _extract_string),
+)
+
+# Eigenschaften, deren Werte (Q-IDs) über ihre Beschreibung aufgelöst werden
+_RESOLVED_PROPERTIES = frozenset(prop for prop, _ in _LIST_PROPS + _ENTITY_PROPS)
+
+# Maximale Anzahl IDs pro wbgetentities-Anfrage (API-Limit)
+_WBGETENTITIES_MAX_IDS = 50
+
+# Ab dieser Anzahl ungecachter IDs wird der SPARQL-Endpunkt statt wbgetentities genutzt
+_SPARQL_MIN_IDS = 100
+
+def _sparql_fetch_descriptions(qids, lang, config):
+    """
+    Retrieve the descriptions of many Wikidata entities with one SPARQL query.
+    
+    Returns:
+        A dict {qid: description or None}, or None if the query failed
+    """
+    values = " ".join(f"wd:{qid}" for qid in qids)
+    query = (
+        f"SELECT ?q ?d WHERE {{ VALUES ?q {{ {values} }} ?q schema:description ?d . "
+        f"FILTER(LANG(?d) = \"{lang}\" || LANG(?d) = \"en\") }}"
+    )
+    try:
+        r = _limited_post(
+            "https://query.wikidata.org/sparql",
+            data={"query": query, "format": "json"},
+            headers={"User-Agent": config.get("USER_AGENT"), "Accept": "application/sparql-results+json"},
+            timeout=config.get('TIMEOUT_THIRD_PARTY', 15)
+        )
+        r.raise_for_status()
+        bindings = json_loads(r.content)["results"]["bindings"]
+    except Exception as e:
+        logging.warning("SPARQL description lookup for %s items failed, falling back to wbgetentities: %s", len(qids), e)
+        return None
+    fetched = dict.fromkeys(qids)
+    for b in bindings:
+        qid = b["q"]["value"].rsplit("/", 1)[-1]
+        if qid in fetched and (fetched[qid] is None or b["d"].get("xml:lang") == lang):
+            fetched[qid] = b["d"]["value"]
+    label_cache.put_many(fetched, lang, config)
+    return fetched
+
+def _batch_fetch_descriptions(qids, lang="de", config=None):
+    """
+    Retrieve the descriptions of several Wikidata entities with wbgetentities
+    (or a single SPARQL query for more than _SPARQL_MIN_IDS uncached IDs).
+    
+    Args:
+        qids: Iterable of Wikidata entity IDs
+        lang: Preferred language for the descriptions ("de" or "en")
+        config: Configuration dictionary with timeout settings
+        
+    Returns:
+        A dict {qid: description or None}; IDs of failed requests are missing
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+        
+    qids = list(qids)
+    result = label_cache.get_many(qids, lang, config)
+    qids = [qid for qid in qids if qid not in result]
+    if len(qids) > _SPARQL_MIN_IDS:
+        # Große Mengen in einer SPARQL-Abfrage statt in ⌈N/50⌉ wbgetentities-Anfragen
+        fetched = _sparql_fetch_descriptions(qids, lang, config)
+        if fetched is not None:
+            result.update(fetched)
+            return result
+    chunks = [qids[start:start + _WBGETENTITIES_MAX_IDS] for start in range(0, len(qids), _WBGETENTITIES_MAX_IDS)]
+    if len(chunks) == 1:
+        result.update(_fetch_description_chunk(chunks[0], lang, config))
+    elif chunks:
+        for future in as_completed([_executor.submit(_fetch_description_chunk, chunk, lang, config) for chunk in chunks]):
+            result.update(future.result())
+    return result
+
+def _fetch_description_chunk(chunk, lang, config):
+    api_url = "https://www.wikidata.org/w/api.php"
+    params = {
+        "action": "wbgetentities",
+        "ids": "|".join(chunk),
+        "props": "descriptions",
+        "languages": lang if lang == "en" else f"{lang}|en",
+        "languagefallback": 1,
+        "format": "json"
+    }
+    try:
+        r = _limited_get(api_url, params=params, headers={"User-Agent": config.get("USER_AGENT")}, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
         r.raise_for_status()
-        data = r.json()
-        entities = data.get("entities", {})
-        entity = entities.get(qid, {})
-        descriptions = entity.get("descriptions", {})
+        entities = json_loads(r.content).get("entities", {})
+    except Exception as e:
+        logging.error("Error retrieving Wikidata descriptions for %s: %s", ",".join(chunk), e)
+        return {}
+    fetched = {}
+    for qid in chunk:
+        descriptions = entities.get(qid, {}).get("descriptions", {})
         description = descriptions.get(lang, {}).get("value")
         if not description and descriptions:
-            description = list(descriptions.values())[0].get("value")
-        return description
-    except Exception as e:
-        logging.error("Error retrieving Wikidata description for %s: %s", qid, e)
+            description = next(iter(descriptions.values()), {}).get("value")
+        fetched[qid] = description
+    label_cache.put_many(fetched, lang, config)
+    return fetched
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_PICKLE5_MAGIC = b"\x80\x05"
+
+# Fehler beim Dekodieren eines Cache-Eintrags (JSONDecodeError ist ein ValueError)
+_DECODE_ERRORS = (ValueError, pickle.UnpicklingError, EOFError) + ((zstd.ZstdError,) if zstd is not None else ())
+
+def _encode_details(result, config):
+    """
+    Serialize details to JSON (or pickle protocol 5) bytes, zstd-compressed if zstandard is installed.
+    """
+    if config.get("CACHE_WIKIDATA_FORMAT") == "pickle5":
+        data = pickle.dumps(result, protocol=5)
+    else:
+        data = json_dumps_bytes(result)
+    if zstd is not None:
+        # (De-)Kompressoren sind nicht thread-safe, daher pro Aufruf erzeugen
+        data = zstd.ZstdCompressor(level=3).compress(data)
+    return data
+
+def _decode_details(data):
+    """
+    Parse details serialized by _encode_details; returns None if they cannot be read.
+    """
+    try:
+        if data[:4] == _ZSTD_MAGIC:
+            if zstd is None:
+                return None
+            data = zstd.ZstdDecompressor().decompress(data)
+        if data[:2] == _PICKLE5_MAGIC:
+            return pickle.loads(data)
+        return json_loads(data)
+    except _DECODE_ERRORS as e:
+        logging.warning("Failed to decode cached Wikidata details: %s", e)
         return None
 
+def _load_legacy_details_cache(entity_id, config):
+    """
+    Load details from the former one-file-per-entity cache (blake2b or SHA-256 file names).
+    """
+    wikidata_cache_dir = os.path.join(config.get("CACHE_DIR", "cache"), "wikidata")
+    cache_key = hashlib.blake2b(entity_id.encode("utf-8"), digest_size=16).hexdigest()
+    legacy_key = hashlib.sha256(entity_id.encode("utf-8")).hexdigest()
+    for name in (f"{cache_key}.json.zst", f"{cache_key}.json", f"{legacy_key}.json"):
+        cache_path = os.path.join(wikidata_cache_dir, name)
+        try:
+            with open(cache_path, "rb") as f:
+                result = _decode_details(f.read())
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            logging.warning("Failed to load Wikidata cache %s: %s", cache_path, e)
+            continue
+        if result is not None:
+            return result
+    return None
+
+def _load_details_cache(entity_id, language, config):
+    """
+    Load cached details from the SQLite store, migrating legacy cache files on first access.
+    """
+    key = (config.get("CACHE_DIR", "cache"), entity_id, language)
+    with _pending_cache_lock:
+        pending = _pending_cache_writes.get(key)
+    if pending is not None:
+        return pending[1]
+    data = label_cache.get_details(entity_id, language, config)
+    if data is not None:
+        return _decode_details(data)
+    result = _load_legacy_details_cache(entity_id, config)
+    if result is not None:
+        _save_details_cache(entity_id, language, result, config)
+    return result
+
+# Cache-Schreibvorgänge laufen in einem Hintergrund-Thread, außerhalb des kritischen Pfads
+_cache_write_queue = queue.Queue()
+_pending_cache_writes = {}  # (cache_dir, entity_id, language) -> (config, result), bis der Eintrag geschrieben ist
+_pending_cache_lock = threading.Lock()
+_cache_writer = None
+_CACHE_FLUSH_BATCH = 256  # Maximale Anzahl Einträge pro SQLite-Transaktion
+
+def _cache_flush_loop():
+    while True:
+        keys = [_cache_write_queue.get()]
+        while len(keys) < _CACHE_FLUSH_BATCH:
+            try:
+                keys.append(_cache_write_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _write_details_cache(keys)
+        except Exception as e:
+            # Der Writer-Thread darf nicht abbrechen, sonst blockiert _drain_cache_writes beim Beenden
+            logging.warning("Failed to save Wikidata cache entries: %s", e)
+        finally:
+            for _ in keys:
+                _cache_write_queue.task_done()
+
+@atexit.register
+def _drain_cache_writes():
+    if _cache_writer is not None:
+        _cache_write_queue.join()
+
+def _save_details_cache(entity_id, language, result, config):
+    """
+    Queue details for writing by the background cache writer.
+    
+    Until the entry is written, _load_details_cache serves the queued result.
+    """
+    global _cache_writer
+    key = (config.get("CACHE_DIR", "cache"), entity_id, language)
+    with _pending_cache_lock:
+        _pending_cache_writes[key] = (config, result)
+        if _cache_writer is None:
+            _cache_writer = threading.Thread(target=_cache_flush_loop, name="wikidata-cache-writer", daemon=True)
+            _cache_writer.start()
+    _cache_write_queue.put(key)
+
+def _write_details_cache(keys):
+    """
+    Write queued details to the SQLite store, one transaction per cache directory.
+    """
+    with _pending_cache_lock:
+        entries = {key: _pending_cache_writes[key] for key in keys if key in _pending_cache_writes}
+    batches = {}
+    for key, (config, result) in entries.items():
+        cache_dir, entity_id, language = key
+        batches.setdefault(cache_dir, (config, []))[1].append((entity_id, language, _encode_details(result, config)))
+    for config, rows in batches.values():
+        label_cache.put_details_many(rows, config)
+    logging.info("Saved %s Wikidata cache entries", len(entries))
+    with _pending_cache_lock:
+        for key, entry in entries.items():
+            if _pending_cache_writes.get(key) is entry:
+                del _pending_cache_writes[key]
+
+# Fehler durch unerwartete Antwortstrukturen (JSONDecodeError ist ein ValueError)
+_PARSE_ERRORS = (ValueError, KeyError, TypeError, AttributeError)
+
+def _fetch_entity_documents(entity_ids, language, config):
+    """
+    Fetch labels, descriptions, aliases and claims for up to 50 entities with one wbgetentities call.
+    """
+    # Nur die benötigten Teile des Entitätsdokuments in der Ziel- und Fallbacksprache laden
+    api_url = "https://www.wikidata.org/w/api.php"
+    params = {
+        "action": "wbgetentities",
+        "ids": "|".join(entity_ids),
+        "props": "labels|descriptions|aliases|claims",
+        "languages": language if language == "en" else f"{language}|en",
+        "languagefallback": 1,
+        "format": "json"
+    }
+    r = _limited_get(api_url, params=params, headers={"User-Agent": config.get("USER_AGENT")}, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
+    r.raise_for_status()
+    return json_loads(r.content).get("entities", {})
+
+def _resolve_referenced_ids(entities, language, config):
+    """
+    Resolve the descriptions of all Q-IDs referenced by the claims of the given entity documents.
+    """
+    # Alle referenzierten Q-IDs sammeln und ihre Beschreibungen gebündelt abrufen
+    referenced_ids = set()
+    for entity in entities:
+        claims = entity.get("claims", {})
+        for prop in _RESOLVED_PROPERTIES & claims.keys():
+            referenced_ids.update(_iter_entity_ids(claims[prop]))
+    resolved = _batch_fetch_descriptions(sorted(referenced_ids), lang=language, config=config)
+    
+    # Fallback: IDs aus fehlgeschlagenen Batches parallel einzeln abfragen
+    missing = {
+        _executor.submit(get_wikidata_description, qid, lang=language, config=config): qid
+        for qid in referenced_ids if qid not in resolved
+    }
+    for future in as_completed(missing):
+        resolved[missing[future]] = future.result()
+    return resolved
+
+def _build_details(entity_id, entity, language, resolved):
+    """
+    Build the details dictionary of an entity document, using resolved Q-ID descriptions.
+    """
+    claims = entity.get("claims", {})
+    labels = entity.get("labels", {})
+    aliases = entity.get("aliases", {})
+    descriptions = entity.get("descriptions", {})
+    
+    # Initialize result dictionary
+    result = {
+        "id": entity_id
+    }
+    
+    # Add description
+    description = descriptions.get(language, {}).get("value")
+    if not description and descriptions:
+        # Fallback to first available language
+        description = next(iter(descriptions.values()), {}).get("value")
+    if description:
+        result["description"] = description
+        
+    # Add label/name
+    label = labels.get(language, {}).get("value")
+    if not label and labels:
+        # Fallback to first available language
+        label = next(iter(labels.values()), {}).get("value")
+    if label:
+        result["label"] = label
+        
+    # Add aliases/alternative names
+    alias_list = aliases.get(language, [])
+    if alias_list:
+        result["aliases"] = [alias.get("value") for alias in alias_list if alias.get("value")]
+        
+    for prop, key in _LIST_PROPS:
+        # dict.fromkeys entfernt Duplikate in O(n) und behält die Reihenfolge bei;
+        # Typ- und Klassenbezeichnungen wiederholen sich über viele Entitäten
+        values = dict.fromkeys(
+            sys.intern(value)
+            for value in map(resolved.get, _iter_entity_ids(claims.get(prop, ())))
+            if value
+        )
+        if values:
+            result[key] = list(values)
+    # types/subclasses sind Aliase von instance_of/subclass_of
+    if "instance_of" in result:
+        result["types"] = list(result["instance_of"])
+    if "subclass_of" in result:
+        result["subclasses"] = list(result["subclass_of"])
+    
+    for prop, key in _ENTITY_PROPS:
+        qid = next(_iter_entity_ids(claims.get(prop, ())[:1]), None)
+        value = resolved.get(qid) if qid else None
+        if value:
+            result[key] = value
+    
+    for prop, key, extract in _SIMPLE_PROPS:
+        dv = _first_datavalue(claims.get(prop, ()))
+        if dv is not None:
+            value = extract(dv)
+            if value:
+                result[key] = value
+    return result
+
 def get_wikidata_details(entity_id, language="de", config=None):
     """
     Retrieve detailed information about a Wikidata entity.
@@ -354,326 +900,87 @@ def get_wikidata_details(entity_id, language="de", config=None):
         config = DEFAULT_CONFIG
         
     # === Wikidata details caching ===
-    if config.get("CACHE_ENABLED") and config.get("CACHE_WIKIDATA_ENABLED") and entity_id:
-        cache_dir = config.get("CACHE_DIR", "cache")
-        wikidata_cache_dir = os.path.join(cache_dir, "wikidata")
-        os.makedirs(wikidata_cache_dir, exist_ok=True)
-        cache_key = hashlib.sha256(entity_id.encode("utf-8")).hexdigest()
-        cache_path = os.path.join(wikidata_cache_dir, f"{cache_key}.json")
-        if os.path.exists(cache_path):
-            logging.info(f"Loaded Wikidata cache for {entity_id}")
-            try:
-                with open(cache_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception as e:
-                logging.warning(f"Failed to load Wikidata cache {cache_path}: {e}")
-                
-    wikidata_url = f"https://www.wikidata.org/wiki/Special:EntityData/{entity_id}.json"
+    use_cache = config.get("CACHE_ENABLED") and config.get("CACHE_WIKIDATA_ENABLED")
+    if use_cache:
+        cached = _load_details_cache(entity_id, language, config)
+        if cached is not None:
+            logging.info("Loaded Wikidata cache for %s", entity_id)
+            return cached
     
     try:
-        r = _limited_get(wikidata_url, headers={"User-Agent": config.get("USER_AGENT")}, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
-        r.raise_for_status()
-        data = r.json()
-        
-        entities = data.get("entities", {})
-        entity = entities.get(entity_id, {})
-        claims = entity.get("claims", {})
-        labels = entity.get("labels", {})
-        aliases = entity.get("aliases", {})
-        descriptions = entity.get("descriptions", {})
-        
-        # Initialize result dictionary
-        result = {
-            "id": entity_id
-        }
-        
-        # Add description
-        description = descriptions.get(language, {}).get("value")
-        if not description and descriptions:
-            # Fallback to first available language
-            description = list(descriptions.values())[0].get("value")
-        if description:
-            result["description"] = description
-            
-        # Add label/name
-        label = labels.get(language, {}).get("value")
-        if not label and labels:
-            # Fallback to first available language
-            label = list(labels.values())[0].get("value")
-        if label:
-            result["label"] = label
-            
-        # Add aliases/alternative names
-        alias_list = aliases.get(language, [])
-        if alias_list:
-            result["aliases"] = [alias.get("value") for alias in alias_list if alias.get("value")]
-            
-        # P31 = instance of
-        instance_claims = claims.get("P31", [])
-        instances = []
-        for claim in instance_claims:
-            if "mainsnak" in claim and "datavalue" in claim["mainsnak"]:
-                dv = claim["mainsnak"]["datavalue"]
-                if dv.get("type") == "wikibase-entityid":
-                    iid = dv["value"]["id"]
-                    ilabel = get_wikidata_description(iid, lang=language, config=config)
-                    if ilabel and ilabel not in instances:
-                        instances.append(ilabel)
-        if instances:
-            result["instance_of"] = instances
-
-        # P279 = subclass of
-        subclass_claims = claims.get("P279", [])
-        subclasses = []
-        for claim in subclass_claims:
-            if "mainsnak" in claim and "datavalue" in claim["mainsnak"]:
-                dv = claim["mainsnak"]["datavalue"]
-                if dv.get("type") == "wikibase-entityid":
-                    sid = dv["value"]["id"]
-                    slabel = get_wikidata_description(sid, lang=language, config=config)
-                    if slabel and slabel not in subclasses:
-                        subclasses.append(slabel)
-        if subclasses:
-            result["subclass_of"] = subclasses
-            
-        # Get types/classes (P31 = "instance of")
-        instance_claims = claims.get("P31", [])
-        types = []
-        
-        for claim in instance_claims:
-            if "mainsnak" in claim and "datavalue" in claim["mainsnak"]:
-                datavalue = claim["mainsnak"]["datavalue"]
-                if datavalue["type"] == "wikibase-entityid":
-                    type_id = datavalue["value"]["id"]
-                    # Get label for this type in the configured language
-                    type_label = get_wikidata_description(type_id, lang=language, config=config)
-                    if type_label and type_label not in types:
-                        types.append(type_label)
-        
-        if types:
-            result["types"] = types
-            
-        # Get subclasses (P279 = "subclass of")
-        subclass_claims = claims.get("P279", [])
-        subclasses = []
-        
-        for claim in subclass_claims:
-            if "mainsnak" in claim and "datavalue" in claim["mainsnak"]:
-                datavalue = claim["mainsnak"]["datavalue"]
-                if datavalue["type"] == "wikibase-entityid":
-                    subclass_id = datavalue["value"]["id"]
-                    subclass_label = get_wikidata_description(subclass_id, lang=language, config=config)
-                    if subclass_label and subclass_label not in subclasses:
-                        subclasses.append(subclass_label)
-        
-        if subclasses:
-            result["subclasses"] = subclasses
-            
-        # Get image (P18 = "image")
-        image_claims = claims.get("P18", [])
-        if image_claims and "mainsnak" in image_claims[0] and "datavalue" in image_claims[0]["mainsnak"]:
-            image_value = image_claims[0]["mainsnak"]["datavalue"].get("value")
-            if image_value:
-                # Convert image name to URL
-                image_name = image_value.replace(" ", "_")
-                # Calculate MD5 hash of image name for Wikimedia Commons URL
-                md5_hash = hashlib.md5(image_name.encode('utf-8')).hexdigest()
-                image_url = f"https://commons.wikimedia.org/wiki/Special:FilePath/{image_name}"
-                result["image_url"] = image_url
-                
-        # Get official website (P856 = "official website")
-        website_claims = claims.get("P856", [])
-        if website_claims and "mainsnak" in website_claims[0] and "datavalue" in website_claims[0]["mainsnak"]:
-            website = website_claims[0]["mainsnak"]["datavalue"].get("value")
-            if website:
-                result["website"] = website
-                
-        # Get coordinates (P625 = "coordinate location")
-        coord_claims = claims.get("P625", [])
-        if coord_claims and "mainsnak" in coord_claims[0] and "datavalue" in coord_claims[0]["mainsnak"]:
-            coord_value = coord_claims[0]["mainsnak"]["datavalue"].get("value", {})
-            if coord_value and "latitude" in coord_value and "longitude" in coord_value:
-                result["coordinates"] = {
-                    "latitude": coord_value["latitude"],
-                    "longitude": coord_value["longitude"]
-                }
-                
-        # Get foundation date (P571 = "inception")
-        foundation_claims = claims.get("P571", [])
-        if foundation_claims and "mainsnak" in foundation_claims[0] and "datavalue" in foundation_claims[0]["mainsnak"]:
-            time_value = foundation_claims[0]["mainsnak"]["datavalue"].get("value", {})
-            if time_value and "time" in time_value:
-                # Format: +YYYY-MM-DDT00:00:00Z
-                time_str = time_value["time"]
-                # Remove the + at the beginning and the T00:00:00Z at the end
-                if time_str.startswith("+"):
-                    time_str = time_str[1:]
-                if "T" in time_str:
-                    time_str = time_str.split("T")[0]
-                result["foundation_date"] = time_str
-                
-        # For persons: Birth date (P569) and death date (P570)
-        birth_claims = claims.get("P569", [])
-        if birth_claims and "mainsnak" in birth_claims[0] and "datavalue" in birth_claims[0]["mainsnak"]:
-            time_value = birth_claims[0]["mainsnak"]["datavalue"].get("value", {})
-            if time_value and "time" in time_value:
-                time_str = time_value["time"]
-                if time_str.startswith("+"):
-                    time_str = time_str[1:]
-                if "T" in time_str:
-                    time_str = time_str.split("T")[0]
-                result["birth_date"] = time_str
-                
-        death_claims = claims.get("P570", [])
-        if death_claims and "mainsnak" in death_claims[0] and "datavalue" in death_claims[0]["mainsnak"]:
-            time_value = death_claims[0]["mainsnak"]["datavalue"].get("value", {})
-            if time_value and "time" in time_value:
-                time_str = time_value["time"]
-                if time_str.startswith("+"):
-                    time_str = time_str[1:]
-                if "T" in time_str:
-                    time_str = time_str.split("T")[0]
-                result["death_date"] = time_str
-                
-        # Get occupations for persons (P106 = "occupation")
-        occupation_claims = claims.get("P106", [])
-        occupations = []
-        
-        for claim in occupation_claims:
-            if "mainsnak" in claim and "datavalue" in claim["mainsnak"]:
-                datavalue = claim["mainsnak"]["datavalue"]
-                if datavalue["type"] == "wikibase-entityid":
-                    occupation_id = datavalue["value"]["id"]
-                    occupation_label = get_wikidata_description(occupation_id, lang=language, config=config)
-                    if occupation_label and occupation_label not in occupations:
-                        occupations.append(occupation_label)
-        
-        if occupations:
-            result["occupations"] = occupations
-            
-        # Add additional properties that might be useful
-        # P27 = country of citizenship
-        citizenship_claims = claims.get("P27", [])
-        citizenships = []
-        
-        for claim in citizenship_claims:
-            if "mainsnak" in claim and "datavalue" in claim["mainsnak"]:
-                datavalue = claim["mainsnak"]["datavalue"]
-                if datavalue["type"] == "wikibase-entityid":
-                    country_id = datavalue["value"]["id"]
-                    country_label = get_wikidata_description(country_id, lang=language, config=config)
-                    if country_label and country_label not in citizenships:
-                        citizenships.append(country_label)
-        
-        if citizenships:
-            result["citizenships"] = citizenships
-            
-        # P19 = place of birth
-        birth_place_claims = claims.get("P19", [])
-        if birth_place_claims and "mainsnak" in birth_place_claims[0] and "datavalue" in birth_place_claims[0]["mainsnak"]:
-            datavalue = birth_place_claims[0]["mainsnak"]["datavalue"]
-            if datavalue["type"] == "wikibase-entityid":
-                place_id = datavalue["value"]["id"]
-                place_label = get_wikidata_description(place_id, lang=language, config=config)
-                if place_label:
-                    result["birth_place"] = place_label
-                    
-        # P20 = place of death
-        death_place_claims = claims.get("P20", [])
-        if death_place_claims and "mainsnak" in death_place_claims[0] and "datavalue" in death_place_claims[0]["mainsnak"]:
-            datavalue = death_place_claims[0]["mainsnak"]["datavalue"]
-            if datavalue["type"] == "wikibase-entityid":
-                place_id = datavalue["value"]["id"]
-                place_label = get_wikidata_description(place_id, lang=language, config=config)
-                if place_label:
-                    result["death_place"] = place_label
-                    
-        # P1448 = official name
-        official_name_claims = claims.get("P1448", [])
-        if official_name_claims and "mainsnak" in official_name_claims[0] and "datavalue" in official_name_claims[0]["mainsnak"]:
-            datavalue = official_name_claims[0]["mainsnak"]["datavalue"]
-            if datavalue["type"] == "monolingualtext":
-                name_value = datavalue["value"]
-                if name_value.get("text"):
-                    result["official_name"] = name_value["text"]
-                    
-        # P1082 = population
-        population_claims = claims.get("P1082", [])
-        if population_claims and "mainsnak" in population_claims[0] and "datavalue" in population_claims[0]["mainsnak"]:
-            datavalue = population_claims[0]["mainsnak"]["datavalue"]
-            if datavalue["type"] == "quantity":
-                population_value = datavalue["value"]
-                if "amount" in population_value:
-                    result["population"] = population_value["amount"]
-            
-        # P361 = part of
-        part_claims = claims.get("P361", [])
-        parts = []
-        for claim in part_claims:
-            if "mainsnak" in claim and "datavalue" in claim["mainsnak"]:
-                dv = claim["mainsnak"]["datavalue"]
-                if dv.get("type") == "wikibase-entityid":
-                    pid = dv["value"]["id"]
-                    plabel = get_wikidata_description(pid, lang=language, config=config)
-                    if plabel and plabel not in parts:
-                        parts.append(plabel)
-        if parts:
-            result["part_of"] = parts
-            
-        # P527 = has part
-        has_part_claims = claims.get("P527", [])
-        has_parts = []
-        for claim in has_part_claims:
-            if "mainsnak" in claim and "datavalue" in claim["mainsnak"]:
-                dv = claim["mainsnak"]["datavalue"]
-                if dv.get("type") == "wikibase-entityid":
-                    hpid = dv["value"]["id"]
-                    hplabel = get_wikidata_description(hpid, lang=language, config=config)
-                    if hplabel and hplabel not in has_parts:
-                        has_parts.append(hplabel)
-        if has_parts:
-            result["has_parts"] = has_parts
-            
-        # P463 = member of
-        member_claims = claims.get("P463", [])
-        members = []
-        for claim in member_claims:
-            if "mainsnak" in claim and "datavalue" in claim["mainsnak"]:
-                dv = claim["mainsnak"]["datavalue"]
-                if dv.get("type") == "wikibase-entityid":
-                    mid = dv["value"]["id"]
-                    mlabel = get_wikidata_description(mid, lang=language, config=config)
-                    if mlabel and mlabel not in members:
-                        members.append(mlabel)
-        if members:
-            result["member_of"] = members
-            
-        # P227 = GND ID
-        gnd_claims = claims.get("P227", [])
-        if gnd_claims and "mainsnak" in gnd_claims[0] and "datavalue" in gnd_claims[0]["mainsnak"]:
-            dv = gnd_claims[0]["mainsnak"]["datavalue"]
-            if dv.get("type") == "string" and dv.get("value"):
-                result["gnd_id"] = dv["value"]
-                
-        # P213 = ISNI
-        isni_claims = claims.get("P213", [])
-        if isni_claims and "mainsnak" in isni_claims[0] and "datavalue" in isni_claims[0]["mainsnak"]:
-            dv = isni_claims[0]["mainsnak"]["datavalue"]
-            if dv.get("type") == "string" and dv.get("value"):
-                result["isni"] = dv["value"]
+        entity = _fetch_entity_documents([entity_id], language, config).get(entity_id, {})
+        resolved = _resolve_referenced_ids([entity], language, config)
+        result = _build_details(entity_id, entity, language, resolved)
             
         # Save Wikidata cache
-        if config.get("CACHE_ENABLED") and config.get("CACHE_WIKIDATA_ENABLED") and entity_id:
-            try:
-                with open(cache_path, "w", encoding="utf-8") as f:
-                    json.dump(result, f)
-                logging.info(f"Saved Wikidata cache for {entity_id} to {cache_path}")
-            except Exception as e:
-                logging.warning(f"Failed to save Wikidata cache {cache_path}: {e}")
+        if use_cache:
+            _save_details_cache(entity_id, language, result, config)
         return result
-    except Exception as e:
+    except requests.RequestException as e:
         logging.error("Error retrieving Wikidata details for %s: %s", entity_id, e)
         return {"id": entity_id}
+    except _PARSE_ERRORS as e:
+        logging.error("Unexpected Wikidata response for %s: %s", entity_id, e)
+        return {"id": entity_id}
+
+def get_wikidata_details_batch(entity_ids, language="de", config=None):
+    """
+    Retrieve detailed information about several Wikidata entities at once.
+    
+    Uncached entities are fetched in wbgetentities batches of 50 IDs on the
+    Wikidata thread pool, and the Q-IDs referenced by all of them are resolved
+    together.
+    
+    Args:
+        entity_ids: Iterable of Wikidata entity IDs
+        language: Language for the labels and descriptions ("de" or "en")
+        config: Configuration dictionary with timeout settings
+        
+    Returns:
+        A dictionary mapping each entity ID to the same dictionary get_wikidata_details would return
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+        
+    entity_ids = list(dict.fromkeys(eid for eid in entity_ids if eid))
+    results = {}
+    use_cache = config.get("CACHE_ENABLED") and config.get("CACHE_WIKIDATA_ENABLED")
+    if use_cache:
+        for entity_id in entity_ids:
+            cached = _load_details_cache(entity_id, language, config)
+            if cached is not None:
+                results[entity_id] = cached
+    missing = [eid for eid in entity_ids if eid not in results]
+    if not missing:
+        return results
+        
+    chunks = [missing[i:i + _WBGETENTITIES_MAX_IDS] for i in range(0, len(missing), _WBGETENTITIES_MAX_IDS)]
+    futures = {_executor.submit(_fetch_entity_documents, chunk, language, config): chunk for chunk in chunks}
+    entities = {}
+    for future in as_completed(futures):
+        try:
+            entities.update(future.result())
+        except (requests.RequestException,) + _PARSE_ERRORS as e:
+            logging.error("Error retrieving Wikidata details for %s: %s", "|".join(futures[future]), e)
+            
+    try:
+        fetched = [entities[eid] for eid in missing if eid in entities]
+        resolved = _resolve_referenced_ids(fetched, language, config)
+    except (requests.RequestException,) + _PARSE_ERRORS as e:
+        logging.error("Error resolving referenced Wikidata items: %s", e)
+        # Unvollständige Ergebnisse zurückgeben, aber nicht cachen
+        resolved = {}
+        use_cache = False
+        
+    for entity_id in missing:
+        if entity_id not in entities:
+            results[entity_id] = {"id": entity_id}
+            continue
+        result = _build_details(entity_id, entities[entity_id], language, resolved)
+        if use_cache:
+            _save_details_cache(entity_id, language, result, config)
+        results[entity_id] = result
+    return results
 
 def get_entity_types_from_wikidata(entity_id, language="de", config=None):
     """
@@ -687,5 +994,26 @@ def get_entity_types_from_wikidata(entity_id, language="de", config=None):
     Returns:
         A list of types or an empty list if not found
     """
+    if config is None:
+        config = DEFAULT_CONFIG
+    key = (entity_id, language) + tuple(config.get(k) for k in _TYPES_CONFIG_KEYS)
+    with _types_memo_lock:
+        types = _types_memo.get(key)
+        if types is not None:
+            _types_memo.move_to_end(key)
+            return list(types)
     details = get_wikidata_details(entity_id, language=language, config=config)
-    return details.get("types", [])
+    types = tuple(details.get("types", []))
+    # Fehlerergebnisse ({"id": ...}) und leere Typlisten nicht memoisieren, der nächste Aufruf fragt erneut an
+    if types:
+        with _types_memo_lock:
+            _types_memo[key] = types
+            if len(_types_memo) > _TYPES_MEMO_MAX_ENTRIES:
+                _types_memo.popitem(last=False)
+    return list(types)
+
+# Konfigurationswerte, die bestimmen, aus welchem Cache die Details stammen
+_TYPES_CONFIG_KEYS = ("CACHE_ENABLED", "CACHE_WIKIDATA_ENABLED", "CACHE_DIR")
+_TYPES_MEMO_MAX_ENTRIES = 16384
+_types_memo = OrderedDict()
+_types_memo_lock = threading.Lock()
@@ -5,33 +5,157 @@ This module provides functions for interacting with the Wikipedia API
 and extracting information from Wikipedia pages.
 """
 
+import asyncio
+import atexit
+import functools
 import logging
 import re
-import requests
+import time
 from bs4 import BeautifulSoup
 import urllib.parse
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, as_completed
 # import wptools
 import os
 import json
 import hashlib
 from entityextractor.services.wikidata_service import generate_entity_synonyms
-from entityextractor.utils.cache_utils import get_cache_path, load_cache, save_cache
-from entityextractor.utils.rate_limiter import RateLimiter
+from entityextractor.services import _wikipedia_cache as wiki_cache
+from entityextractor.utils.rate_limiter import PerHostRateLimiter, AdaptiveConcurrencyLimiter
+from entityextractor.utils.http_utils import create_session
+from entityextractor.utils.singleflight import SingleFlight
+from entityextractor.utils.json_utils import json_loads
 from entityextractor.config.settings import get_config, DEFAULT_CONFIG
 from entityextractor.utils.text_utils import is_valid_wikipedia_url
 from entityextractor.utils.wiki_url_utils import sanitize_wikipedia_url
 
+try:
+    from lxml import html as lxml_html
+    _HTML_PARSER = "lxml"  # C-Parser (libxml2), deutlich schneller als html.parser
+except ImportError:
+    lxml_html = None
+    _HTML_PARSER = "html.parser"
+
+# Zeilen der ersten Infobox mit Schlüssel (th) und Wert (td), in libxml2 ausgewertet
+_INFOBOX_ROWS_XPATH = '(//table[contains(concat(" ", normalize-space(@class), " "), " infobox ")])[1]//tr[th and td]'
+
 _config = get_config()
-_rate_limiter = RateLimiter(_config["RATE_LIMIT_MAX_CALLS"], _config["RATE_LIMIT_PERIOD"], _config["RATE_LIMIT_BACKOFF_BASE"], _config["RATE_LIMIT_BACKOFF_MAX"])
+_rate_limiter = PerHostRateLimiter(
+    _config["RATE_LIMIT_MAX_CALLS"], _config["RATE_LIMIT_PERIOD"], _config["RATE_LIMIT_BACKOFF_BASE"], _config["RATE_LIMIT_BACKOFF_MAX"],
+    host_max_calls=_config.get("RATE_LIMIT_HOST_MAX_CALLS"),
+    retry_on_429=False  # 429/5xx werden von der Session (urllib3 Retry) wiederholt
+)
+# Begrenzt gleichzeitig offene Wikipedia-Anfragen prozessweit (nicht nur pro Thread-Pool)
+_concurrency_limiter = AdaptiveConcurrencyLimiter(
+    _config.get("WIKIPEDIA_CONCURRENCY", 8),
+    increase=_config.get("ADAPTIVE_CONCURRENCY_INCREASE", 0.5),
+    decrease=_config.get("ADAPTIVE_CONCURRENCY_DECREASE", 0.5),
+    backoff_base=_config["RATE_LIMIT_BACKOFF_BASE"],
+    backoff_max=_config["RATE_LIMIT_BACKOFF_MAX"]
+)
+# Eine Session für alle *.wikipedia.org-Anfragen, damit TCP/TLS-Verbindungen wiederverwendet werden
+_session = create_session(_config)
+atexit.register(_session.close)
 
+@_concurrency_limiter
 @_rate_limiter
-def _limited_get(url, **kwargs):
-    return requests.get(url, **kwargs)
+def _rate_limited_get(url, **kwargs):
+    return _session.get(url, **kwargs)
+
+def _limited_get(url, config=None, **kwargs):
+    """
+    Rate-limited GET that waits out MediaWiki maxlag errors.
+    
+    MediaWiki answers a request whose maxlag is exceeded with an error marked
+    by the MediaWiki-API-Error header and a Retry-After delay. The request is
+    repeated after that delay (capped at RATE_LIMIT_BACKOFF_MAX) up to
+    WIKIPEDIA_MAXLAG_RETRIES times, both read from config. HTTP 429/5xx are
+    retried by the session.
+    """
+    if config is None:
+        config = _config
+    for _ in range(config.get("WIKIPEDIA_MAXLAG_RETRIES", 2)):
+        r = _rate_limited_get(url, **kwargs)
+        if r.headers.get("MediaWiki-API-Error") != "maxlag":
+            return r
+        try:
+            wait = float(r.headers.get("Retry-After", 5))
+        except ValueError:
+            wait = 5
+        wait = min(max(wait, 1), config.get("RATE_LIMIT_BACKOFF_MAX", 60))
+        logging.warning("Wikipedia replication lag above maxlag for %s, retrying in %.0fs", url, wait)
+        r.close()
+        time.sleep(wait)
+    return _rate_limited_get(url, **kwargs)
+
+# Vorkompilierte Muster; Bytes-Varianten durchsuchen die HTML-Antwort ohne sie komplett zu dekodieren
+_RE_CANONICAL = re.compile(rb'<link rel="canonical" href="([^"]+)"')
+_RE_TITLE_TAG = re.compile(rb'<title>([^<]+)</title>')
+_RE_WIKI_PATH = re.compile(r'/wiki/([^#]+)')
+_RE_TITLE_SUFFIX = re.compile(r'[\s]*[–-][\s]*Wikipedia.*$')
+_RE_PARENS = re.compile(r'[()]')
+
+# Muster für _wikitext_to_text (Einleitung aus action=parse&prop=wikitext in Klartext umwandeln)
+_RE_WT_COMMENT = re.compile(r'<!--.*?-->', re.DOTALL)
+_RE_WT_REF = re.compile(r'<ref[^>]*/>|<ref[^>]*>.*?</ref>', re.DOTALL | re.IGNORECASE)
+_RE_WT_TEMPLATE = re.compile(r'\{\{[^{}]*\}\}')  # innerste Vorlage; wiederholt anwenden für Verschachtelung
+_RE_WT_TABLE = re.compile(r'\{\|.*?\|\}', re.DOTALL)
+_RE_WT_FILE = re.compile(r'\[\[(?:Datei|File|Bild|Image|Kategorie|Category):(?:[^\[\]]|\[\[[^\[\]]*\]\])*\]\]', re.IGNORECASE)
+_RE_WT_LINK = re.compile(r'\[\[(?:[^|\[\]]*\|)?([^\[\]]*)\]\]')
+_RE_WT_EXTLINK = re.compile(r'\[https?://[^\s\]]*\s*([^\]]*)\]')
+_RE_WT_FORMAT = re.compile(r"'{2,}")
+_RE_WT_TAG = re.compile(r'<[^>]+>')
+
+# Thread-Pool für unabhängige Wikipedia-Anfragen; _limited_get bleibt die Drosselstelle
+_executor = ThreadPoolExecutor(max_workers=_config.get("WIKIPEDIA_CONCURRENCY", 8), thread_name_prefix="wikipedia")
+
+def _wikitext_to_text(wikitext, max_paragraphs=3):
+    """
+    Convert lead-section wikitext into plain text.
+    
+    Removes comments, references, templates, tables, files and categories,
+    keeps the labels of internal and external links and drops markup.
+    
+    Returns:
+        The first max_paragraphs paragraphs joined by spaces, or an empty string
+    """
+    text = _RE_WT_REF.sub('', _RE_WT_COMMENT.sub('', wikitext))
+    previous = None
+    while previous != text:
+        previous = text
+        text = _RE_WT_TEMPLATE.sub('', text)
+    text = _RE_WT_TABLE.sub('', text)
+    text = _RE_WT_FILE.sub('', text)
+    text = _RE_WT_LINK.sub(r'\1', text)
+    text = _RE_WT_EXTLINK.sub(r'\1', text)
+    text = _RE_WT_TAG.sub('', _RE_WT_FORMAT.sub('', text))
+    paragraphs = (
+        ' '.join(block.split())
+        for block in text.split('\n\n')
+    )
+    return ' '.join(islice((p for p in paragraphs if p and not p.startswith('=')), max_paragraphs))
+
+@functools.lru_cache(maxsize=4096)
+def _parse_wiki_url(url):
+    """
+    Split a Wikipedia article URL into language code and plain title.
+    
+    Returns:
+        Tuple of (language code or None, unquoted title without fragment or None)
+    """
+    parts = urllib.parse.urlsplit(url)
+    lang = parts.netloc.split('.', 1)[0] or None
+    _, sep, title = parts.path.partition('/wiki/')
+    return lang, (urllib.parse.unquote(title) or None) if sep else None
 
 def get_wikipedia_title_in_language(title, from_lang="de", to_lang="en", config=None):
     """
     Convert a Wikipedia title from one language to another using interlanguage links.
     
+    Results are memoized in-process per title, language pair and the
+    request-relevant configuration values; concurrent lookups of the same
+    title share one request.
+    
     Args:
         title: The Wikipedia article title
         from_lang: Source language of the title
@@ -47,6 +171,38 @@ def get_wikipedia_title_in_language(title, from_lang="de", to_lang="en", config=
     if config is None:
         config = DEFAULT_CONFIG
         
+    config_key = tuple(config.get(key) for key in _LANGLINK_CONFIG_KEYS)
+    try:
+        # lru_cache verhindert keine parallelen Misses, daher gleiche Anfragen bündeln
+        key = (title, from_lang, to_lang, config_key)
+        return _langlink_flight.do(key, _title_in_language_cached, *key)
+    except Exception as e:
+        # Fehler werden nicht memoisiert, der nächste Aufruf fragt erneut an
+        logging.error(f"Error retrieving translation for {title}: {e}")
+        return None
+
+# Konfigurationswerte, die das Ergebnis von get_wikipedia_title_in_language beeinflussen
+# bzw. von _limited_get gelesen werden
+_LANGLINK_CONFIG_KEYS = (
+    "CACHE_ENABLED", "CACHE_WIKIPEDIA_ENABLED", "CACHE_DIR", "WIKIPEDIA_NEG_TTL",
+    "USER_AGENT", "WIKIPEDIA_MAXLAG", "TIMEOUT_THIRD_PARTY",
+    "WIKIPEDIA_MAXLAG_RETRIES", "RATE_LIMIT_BACKOFF_MAX"
+)
+_langlink_flight = SingleFlight()
+
+@functools.lru_cache(maxsize=8192)
+def _title_in_language_cached(title, from_lang, to_lang, config_key):
+    config = dict(zip(_LANGLINK_CONFIG_KEYS, config_key))
+    
+    cache_key = f"{from_lang}|{to_lang}|{title}"
+    cached = wiki_cache.get("langlinks", cache_key, config)
+    if cached is not None:
+        if not cached.get("miss"):
+            return cached.get("title")
+        if time.time() - cached.get("ts", 0) < config.get("WIKIPEDIA_NEG_TTL", 86400):
+            logging.info(f"No translation from {from_lang}:{title} to {to_lang} (cached miss)")
+            return None
+        
     api_url = f"https://{from_lang}.wikipedia.org/w/api.php"
     params = {
         "action": "query",
@@ -59,31 +215,28 @@ def get_wikipedia_title_in_language(title, from_lang="de", to_lang="en", config=
     
     headers = {"User-Agent": config.get("USER_AGENT")}
     
-    try:
-        logging.info(f"Searching translation from {from_lang}:{title} to {to_lang}")
-        r = _limited_get(api_url, params=params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
-        r.raise_for_status()
-        data = r.json()
-        
-        pages = data.get("query", {}).get("pages", {})
-        target_title = None
-        
-        for page_id, page in pages.items():
-            langlinks = page.get("langlinks", [])
-            if langlinks:
-                # Take the first entry - this should be the target language version
-                target_title = langlinks[0].get("*")
-                break
-                
-        if target_title:
-            logging.info(f"Translation found: {from_lang}:{title} -> {to_lang}:{target_title}")
-            return target_title
-        else:
-            logging.info(f"No translation found from {from_lang}:{title} to {to_lang}")
-            return None
+    logging.info(f"Searching translation from {from_lang}:{title} to {to_lang}")
+    r = _limited_get(api_url, params=params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15), config=config)
+    r.raise_for_status()
+    data = json_loads(r.content)
+    
+    pages = data.get("query", {}).get("pages", {})
+    target_title = None
+    
+    for page_id, page in pages.items():
+        langlinks = page.get("langlinks", [])
+        if langlinks:
+            # Take the first entry - this should be the target language version
+            target_title = langlinks[0].get("*")
+            break
             
-    except Exception as e:
-        logging.error(f"Error retrieving translation for {title}: {e}")
+    if target_title:
+        logging.info(f"Translation found: {from_lang}:{title} -> {to_lang}:{target_title}")
+        wiki_cache.put("langlinks", cache_key, {"title": target_title}, config)
+        return target_title
+    else:
+        logging.info(f"No translation found from {from_lang}:{title} to {to_lang}")
+        wiki_cache.put("langlinks", cache_key, {"miss": True, "ts": time.time()}, config)
         return None
 
 def convert_to_de_wikipedia_url(wikipedia_url):
@@ -101,25 +254,13 @@ def convert_to_de_wikipedia_url(wikipedia_url):
     if "de.wikipedia.org" in wikipedia_url:
         return wikipedia_url, None
 
-    try:
-        # Extract the title from the original URL
-        splitted = wikipedia_url.split("/wiki/")
-        if len(splitted) < 2:
-            logging.warning("Wikipedia URL has unexpected format: %s", wikipedia_url)
-            return wikipedia_url, None
-        original_title = splitted[1].split("#")[0]
-    except Exception as e:
-        logging.error("Error extracting title from URL %s: %s", wikipedia_url, e)
+    from_lang, original_title = _parse_wiki_url(wikipedia_url)
+    if not original_title:
+        logging.warning("Wikipedia URL has unexpected format: %s", wikipedia_url)
         return wikipedia_url, None
+    from_lang = from_lang or "en"
         
     try:
-        # Determine the source language from the domain
-        if "://" in wikipedia_url:
-            domain = wikipedia_url.split("://")[1].split("/")[0]
-            from_lang = domain.split('.')[0]
-        else:
-            from_lang = "en"
-            
         # Get the German title using interlanguage links
         de_title = get_wikipedia_title_in_language(original_title, from_lang=from_lang, to_lang="de")
         
@@ -142,7 +283,7 @@ def fallback_wikipedia_url(query, langs=None, language="de", config=None):
         query = urllib.parse.unquote(query)
         # Normalize query: replace underscores and remove parentheses for better search
         query = query.replace('_', ' ')
-        query = re.sub(r'[()]', '', query)
+        query = _RE_PARENS.sub('', query)
     except Exception as e:
         logging.warning(f"Error decoding query for fallback: {e}")
     """
@@ -189,10 +330,10 @@ def fallback_wikipedia_url(query, langs=None, language="de", config=None):
             
             logging.info(f"Fallback ({lang}): Searching Wikipedia URL for '{query}'...")
             
-            response = _limited_get(api_url, params=params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
+            response = _limited_get(api_url, params=params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15), config=config)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             if data and len(data) > 3 and data[3] and len(data[3]) > 0:
                 url = data[3][0]
                 if is_valid_wikipedia_url(url):
@@ -204,40 +345,104 @@ def fallback_wikipedia_url(query, langs=None, language="de", config=None):
     logging.warning(f"Fallback failed: No Wikipedia URL found for '{query}'.")
     return None
 
-def follow_wikipedia_redirect(url, entity_name):
+_HTML_HEAD_MAX_BYTES = 32 * 1024
+
+def _read_html_head(response, max_bytes=_HTML_HEAD_MAX_BYTES):
+    """
+    Read a streamed HTML response only up to </head> (at most max_bytes) and close it.
+    """
+    buf = bytearray()
+    try:
+        for chunk in response.iter_content(8192):
+            buf += chunk
+            if b"</head>" in buf or len(buf) >= max_bytes:
+                break
+    finally:
+        response.close()
+    return bytes(buf)
+
+def _resolve_redirect_via_api(url, entity_name, config):
+    """
+    Resolve redirects of a Wikipedia URL with action=query&redirects=1.
+    
+    Returns:
+        Tuple of (final URL, page title), or None if the API returned no existing page
+    """
+    lang, title = _parse_wiki_url(url)
+    if not lang or not title:
+        return None
+    params = {
+        "action": "query",
+        "titles": title,
+        "redirects": 1,
+        "prop": "info",
+        "inprop": "url",
+        "format": "json",
+        "maxlag": config.get("WIKIPEDIA_MAXLAG")
+    }
+    r = _limited_get(f"https://{lang}.wikipedia.org/w/api.php", params=params, timeout=config.get('TIMEOUT_THIRD_PARTY', 15), config=config)
+    r.raise_for_status()
+    query = json_loads(r.content).get("query", {})
+    page = next(iter(query.get("pages", {}).values()), None)
+    if not page or "missing" in page or "invalid" in page:
+        return None
+    page_title = page.get("title") or entity_name
+    if query.get("redirects"):
+        final_url = page.get("fullurl") or url
+        logging.info(f"Wikipedia-Redirect detected: {url} -> {final_url}")
+        logging.info(f"Entity corrected: '{entity_name}' -> '{page_title}'")
+        return final_url, page_title
+    if page_title.lower() != entity_name.lower():
+        logging.info(f"Wikipedia-Title-Correction: '{entity_name}' -> '{page_title}'")
+    else:
+        logging.info(f"Wikipedia-Opensearch: '{entity_name}' -> {url} | Official title: '{page_title}'")
+    return url, page_title
+
+def follow_wikipedia_redirect(url, entity_name, config=None):
     url = sanitize_wikipedia_url(url)
     """
     Follow Wikipedia redirects and extract the actual page title.
     
-    1. Directly check the provided URL for redirects via HTTP request.
-    2. Extract the real Wikipedia title from <title> of the target page.
+    1. Resolve redirects and the canonical title via the MediaWiki API.
+    2. If the API returns no page, check the page HTML for a canonical link
+       and read the title from <title>.
     3. Return final URL and title.
     
     Args:
         url: Initial Wikipedia URL
         entity_name: Original entity name
+        config: Optional configuration dictionary
         
     Returns:
         Tuple of (final URL, page title)
     """
+    if config is None:
+        config = DEFAULT_CONFIG
     if not url:
         logging.warning(f"No URL provided for '{entity_name}'")
         return None, None
         
+    try:
+        resolved = _resolve_redirect_via_api(url, entity_name, config)
+        if resolved:
+            return resolved
+    except Exception as e:
+        logging.warning(f"Wikipedia-Redirect check via API failed, falling back to HTML: {e}")
+        
     try:
         # Follow redirects and get the final URL
-        response = requests.get(url, allow_redirects=True)
+        response = _limited_get(url, allow_redirects=True, stream=True, timeout=config.get('TIMEOUT_THIRD_PARTY', 15), config=config)
         final_url = response.url
-        html = response.text
+        html = _read_html_head(response)
         
         # Check for soft redirect via canonical link
-        canonical_match = re.search(r'<link rel="canonical" href="([^"]+)"', html)
+        canonical_match = _RE_CANONICAL.search(html)
         if canonical_match:
-            canonical_url = canonical_match.group(1)
+            canonical_url = canonical_match.group(1).decode("utf-8", "replace")
             if canonical_url != final_url:
                 logging.info(f"Wikipedia-Soft-Redirect (canonical) detected: {final_url} -> {canonical_url}")
                 # Extract title from canonical URL
-                title_match = re.search(r'/wiki/([^#]+)', canonical_url)
+                title_match = _RE_WIKI_PATH.search(canonical_url)
                 if title_match:
                     canonical_title = urllib.parse.unquote(title_match.group(1)).replace('_', ' ')
                     logging.info(f"Entity corrected: '{entity_name}' -> '{canonical_title}'")
@@ -245,11 +450,11 @@ def follow_wikipedia_redirect(url, entity_name):
                 return canonical_url, entity_name
         
         # Extract page title from HTML
-        title_match = re.search(r'<title>([^<]+)</title>', html)
+        title_match = _RE_TITLE_TAG.search(html)
         if title_match:
-            page_title = title_match.group(1)
+            page_title = title_match.group(1).decode("utf-8", "replace")
             # Remove " - Wikipedia" oder " – Wikipedia" suffix (berücksichtigt sowohl Bindestrich als auch Gedankenstrich)
-            page_title = re.sub(r'[\s]*[–-][\s]*Wikipedia.*$', '', page_title)
+            page_title = _RE_TITLE_SUFFIX.sub('', page_title)
             
             if page_title.lower() != entity_name.lower():
                 logging.info(f"Wikipedia-Title-Correction: '{entity_name}' -> '{page_title}'")
@@ -257,13 +462,12 @@ def follow_wikipedia_redirect(url, entity_name):
                 logging.info(f"Wikipedia-Opensearch: '{entity_name}' -> {final_url} | Official title: '{page_title}'")
             return final_url, page_title
         else:
-            logging.info(f"Wikipedia-Opensearch: '{entity_name}' -> {final_url} | Official title: '{page_title}'")
-            return final_url, page_title
+            logging.info(f"Wikipedia-Opensearch: '{entity_name}' -> {final_url} | No title found")
+            return final_url, entity_name
     except Exception as e:
         logging.warning(f"Wikipedia-Redirect/Title-Check failed: {e}")
-        splitted = url.split("/wiki/")
-        title = splitted[1].split("#")[0].replace('_', ' ') if len(splitted) >= 2 else entity_name
-        return url, title
+        title = _parse_wiki_url(url)[1]
+        return url, title.replace('_', ' ') if title else entity_name
 
 def get_wikipedia_extract(wikipedia_url, config=None):
     # Für API-Parameter: Klartext-Titel verwenden
@@ -282,36 +486,26 @@ def get_wikipedia_extract(wikipedia_url, config=None):
     if config is None:
         config = DEFAULT_CONFIG
     # === Wikipedia extract caching ===
-    if config.get("CACHE_ENABLED") and config.get("CACHE_WIKIPEDIA_ENABLED"):
-        cache_path = get_cache_path(config.get("CACHE_DIR", "cache"), "wikipedia", wikipedia_url)
-        cached = load_cache(cache_path)
-        if cached is not None:
+    use_cache = config.get("CACHE_ENABLED") and config.get("CACHE_WIKIPEDIA_ENABLED")
+    if use_cache:
+        cached = wiki_cache.get("extract", wikipedia_url, config)
+        if cached is not None and cached.get("miss"):
+            # Negativ-Cache: bekannte Fehlschläge innerhalb der TTL nicht erneut durchlaufen
+            if time.time() - cached.get("ts", 0) < config.get("WIKIPEDIA_NEG_TTL", 86400):
+                logging.info(f"Skipping Wikipedia extract lookup for {wikipedia_url} (cached miss)")
+                return None, None
+            logging.info(f"Cached miss for {wikipedia_url} expired, fetching from API")
+        elif cached is not None:
             logging.info(f"Loaded Wikipedia extract from cache for {wikipedia_url}")
             return cached.get("extract"), cached.get("wikidata_id")
         else:
             logging.info(f"No Wikipedia extract cache found for {wikipedia_url}, fetching from API")
         
-    try:
-        splitted = wikipedia_url.split("/wiki/")
-        if len(splitted) < 2:
-            logging.warning("Wikipedia URL has unexpected format (Extract): %s", wikipedia_url)
-            return None, None
-        title = splitted[1].split("#")[0]
-        title_plain = urllib.parse.unquote(title)
-    except Exception as e:
-        logging.error("Error extracting title for extract: %s", e)
+    lang, title_plain = _parse_wiki_url(wikipedia_url)
+    if not title_plain:
+        logging.warning("Wikipedia URL has unexpected format (Extract): %s", wikipedia_url)
         return None, None
-
-    try:
-        if "://" in wikipedia_url:
-            domain = wikipedia_url.split("://")[1].split("/")[0]
-            lang = domain.split('.')[0]
-        else:
-            domain = "de.wikipedia.org"
-            lang = "de"
-    except Exception as e:
-        logging.error("Error determining language for extract: %s", e)
-        lang = "de"
+    lang = lang or "de"
 
     try:
         # 1. Versuch: Wikipedia API für Extract (LLM-URL)
@@ -328,9 +522,9 @@ def get_wikipedia_extract(wikipedia_url, config=None):
         }
         headers = {"User-Agent": config.get("USER_AGENT")}
         
-        r = _limited_get(api_url, params=params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
+        r = _limited_get(api_url, params=params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15), config=config)
         r.raise_for_status()
-        data = r.json()
+        data = json_loads(r.content)
         pages = data.get("query", {}).get("pages", {})
         for page_id, page in pages.items():
             extract_text = page.get("extract", "")
@@ -338,8 +532,8 @@ def get_wikipedia_extract(wikipedia_url, config=None):
             if extract_text:
                 logging.info(f"Wikipedia extract for URL {wikipedia_url} successfully loaded.")
                 # Save cache
-                if config.get("CACHE_ENABLED") and config.get("CACHE_WIKIPEDIA_ENABLED"):
-                    save_cache(cache_path, {"extract": extract_text, "wikidata_id": wikidata_id})
+                if use_cache:
+                    wiki_cache.put("extract", wikipedia_url, {"extract": extract_text, "wikidata_id": wikidata_id}, config)
                     logging.info(f"Saved Wikipedia extract cache for {wikipedia_url}")
                 return extract_text, wikidata_id
         # Kein Extract gefunden: Prüfe Softredirect vor Opensearch
@@ -347,19 +541,18 @@ def get_wikipedia_extract(wikipedia_url, config=None):
         # Fragment entfernen
         base_url = wikipedia_url.split('#')[0]
         # Softredirect prüfen
-        final_url, final_title = follow_wikipedia_redirect(base_url, title_plain)
+        final_url, final_title = follow_wikipedia_redirect(base_url, title_plain, config)
         if final_url and final_url != base_url:
             logging.info(f"Softredirect erkannt: {base_url} -> {final_url} | Versuche Extrakt erneut.")
             try:
-                sr_spl = final_url.split("/wiki/")
-                if len(sr_spl) >= 2:
-                    sr_title_plain = urllib.parse.unquote(sr_spl[1].split("#")[0])
+                sr_title_plain = _parse_wiki_url(final_url)[1]
+                if sr_title_plain:
                     srv_api = f"https://{lang}.wikipedia.org/w/api.php"
                     srv_params = params.copy()
                     srv_params["titles"] = sr_title_plain
-                    r_sr = _limited_get(srv_api, params=srv_params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
+                    r_sr = _limited_get(srv_api, params=srv_params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15), config=config)
                     r_sr.raise_for_status()
-                    srv_pages = r_sr.json().get("query", {}).get("pages", {})
+                    srv_pages = json_loads(r_sr.content).get("query", {}).get("pages", {})
                     for srv_page in srv_pages.values():
                         srv_extract = srv_page.get("extract", "")
                         if srv_extract:
@@ -374,17 +567,14 @@ def get_wikipedia_extract(wikipedia_url, config=None):
         fallback_url = fallback_wikipedia_url(title_plain, langs=priority_langs)
         if fallback_url and fallback_url != base_url:
             try:
-                fb_spl = fallback_url.split("/wiki/")
-                if len(fb_spl) >= 2:
-                    fb_title_plain = urllib.parse.unquote(fb_spl[1].split("#")[0])
-                    parsed_fb = urllib.parse.urlparse(fallback_url)
-                    fb_lang = parsed_fb.netloc.split('.')[0]
+                fb_lang, fb_title_plain = _parse_wiki_url(fallback_url)
+                if fb_title_plain:
                     fb_api_url = f"https://{fb_lang}.wikipedia.org/w/api.php"
                     fb_params = params.copy()
                     fb_params["titles"] = fb_title_plain
-                    r_fb = _limited_get(fb_api_url, params=fb_params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
+                    r_fb = _limited_get(fb_api_url, params=fb_params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15), config=config)
                     r_fb.raise_for_status()
-                    fb_pages = r_fb.json().get("query", {}).get("pages", {})
+                    fb_pages = json_loads(r_fb.content).get("query", {}).get("pages", {})
                     for fb_page in fb_pages.values():
                         fb_extract = fb_page.get("extract", "")
                         if fb_extract:
@@ -392,79 +582,81 @@ def get_wikipedia_extract(wikipedia_url, config=None):
                             return fb_extract, None
             except Exception as e:
                 logging.error(f"Error retrieving Wikipedia extract for fallback URL {fallback_url}: {e}")
-        logging.warning(f"No Wikipedia extract found via API for both URL {wikipedia_url} and fallback. Trying BeautifulSoup...")
+        logging.warning(f"No Wikipedia extract found via API for both URL {wikipedia_url} and fallback. Trying lead wikitext...")
         try:
-            response = requests.get(wikipedia_url, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
-            response.raise_for_status()
-            html = response.text
-            soup = BeautifulSoup(html, 'html.parser')
-            content = None
-            main_content = soup.select_one('#mw-content-text > .mw-parser-output')
-            if main_content:
-                paragraphs = []
-                for p in main_content.find_all('p'):
-                    if p.text.strip() and not p.find_parent(class_='infobox'):
-                        paragraphs.append(p.text.strip())
-                if paragraphs:
-                    content = ' '.join(paragraphs[:3])
-            if not content:
-                first_heading = soup.select_one('.mw-headline')
-                if first_heading and first_heading.parent:
-                    section = first_heading.parent.find_next_sibling()
-                    section_text = []
-                    while section and section.name != 'h2' and section.name != 'h3':
-                        if section.name == 'p' and section.text.strip():
-                            section_text.append(section.text.strip())
-                        section = section.find_next_sibling()
-                    if section_text:
-                        content = ' '.join(section_text[:3])
-            if not content:
-                all_paragraphs = soup.select('#bodyContent p')
-                paragraphs = [p.text.strip() for p in all_paragraphs if p.text.strip() and not p.find_parent(class_='infobox')]
-                if paragraphs:
-                    content = ' '.join(paragraphs[:3])
+            # Nur die Wikitext-Einleitung (section=0) statt der kompletten HTML-Seite laden
+            wt_params = {
+                "action": "parse",
+                "page": title_plain,
+                "prop": "wikitext",
+                "section": 0,
+                "redirects": 1,
+                "format": "json",
+                "maxlag": config.get("WIKIPEDIA_MAXLAG")
+            }
+            r_wt = _limited_get(api_url, params=wt_params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15), config=config)
+            r_wt.raise_for_status()
+            wikitext = json_loads(r_wt.content).get('parse', {}).get('wikitext', {}).get('*', '')
+            content = _wikitext_to_text(wikitext) if wikitext else ''
             if content:
-                logging.info(f"BeautifulSoup: Extract successfully extracted for {wikipedia_url}.")
+                logging.info(f"Wikitext: Extract successfully extracted for {wikipedia_url}.")
                 return content, None
             else:
-                logging.warning(f"BeautifulSoup: No paragraphs found in content for {wikipedia_url}.")
+                logging.warning(f"Wikitext: No paragraphs found in lead section for {wikipedia_url}.")
                 # continue to LLM-synonym fallback
-        except Exception as bs_error:
-            logging.error(f"Error in BeautifulSoup fallback for {wikipedia_url}: {bs_error}")
+        except Exception as wt_error:
+            logging.error(f"Error in wikitext fallback for {wikipedia_url}: {wt_error}")
             # continue to LLM-synonym fallback
     except Exception as e:
         logging.error(f"Error during Wikipedia API and fallback flow for URL {wikipedia_url}: {e}")
         # continue to LLM-synonym fallback
 
-    # LLM-Synonym-Fallback nach BeautifulSoup
-    logging.warning(f"No extract via BeautifulSoup; trying LLM-generated synonyms for '{title_plain}'...")
+    # LLM-Synonym-Fallback nach Wikitext
+    logging.warning(f"No extract via wikitext; trying LLM-generated synonyms for '{title_plain}'...")
     synonyms = generate_entity_synonyms(title_plain, language=lang, config=config)
-    for syn in synonyms:
-        try:
-            logging.info(f"Trying fallback for synonym '{syn}'..." )
-            # Single fallback call with priority languages
-            priority_langs = [lang] if lang == 'en' else [lang, 'en']
-            syn_url = fallback_wikipedia_url(syn, langs=priority_langs)
-            if syn_url:
-                parsed_syn = urllib.parse.urlparse(syn_url)
-                syn_lang = parsed_syn.netloc.split('.')[0]
-                syn_title = urllib.parse.unquote(parsed_syn.path.split('/wiki/')[1].split('#')[0])
-                syn_api = f"https://{syn_lang}.wikipedia.org/w/api.php"
-                syn_params = params.copy()
-                syn_params['titles'] = syn_title
-                r_syn = _limited_get(syn_api, params=syn_params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
-                r_syn.raise_for_status()
-                pages_syn = r_syn.json().get('query', {}).get('pages', {})
-                for page in pages_syn.values():
-                    syn_ext = page.get('extract', '')
-                    if syn_ext:
-                        logging.info(f"Extract for synonym '{syn}' successful.")
-                        return syn_ext, None
-        except Exception as se:
-            logging.error(f"Error retrieving extract for synonym '{syn}': {se}")
+    # Alle Synonyme parallel versuchen; der erste gefundene Extract gewinnt,
+    # noch nicht gestartete Versuche werden dann abgebrochen
+    futures = {
+        _executor.submit(_fetch_extract_for_synonym, syn, lang, params, headers, config): syn
+        for syn in synonyms
+    }
+    for future in as_completed(futures):
+        syn_ext = future.result()
+        if syn_ext:
+            for other in futures:
+                other.cancel()
+            logging.info(f"Extract for synonym '{futures[future]}' successful.")
+            return syn_ext, None
     logging.warning(f"No extract found using LLM-generated synonyms for '{title_plain}'.")
+    if use_cache:
+        wiki_cache.put("extract", wikipedia_url, {"miss": True, "ts": time.time()}, config)
     return None, None
 
+def _fetch_extract_for_synonym(syn, lang, params, headers, config):
+    """
+    Search a Wikipedia article for a synonym and return its extract, or None.
+    """
+    try:
+        logging.info(f"Trying fallback for synonym '{syn}'..." )
+        # Single fallback call with priority languages
+        priority_langs = [lang] if lang == 'en' else [lang, 'en']
+        syn_url = fallback_wikipedia_url(syn, langs=priority_langs)
+        if syn_url:
+            syn_lang, syn_title = _parse_wiki_url(syn_url)
+            syn_api = f"https://{syn_lang}.wikipedia.org/w/api.php"
+            syn_params = params.copy()
+            syn_params['titles'] = syn_title
+            r_syn = _limited_get(syn_api, params=syn_params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15), config=config)
+            r_syn.raise_for_status()
+            pages_syn = json_loads(r_syn.content).get('query', {}).get('pages', {})
+            for page in pages_syn.values():
+                syn_ext = page.get('extract', '')
+                if syn_ext:
+                    return syn_ext
+    except Exception as se:
+        logging.error(f"Error retrieving extract for synonym '{syn}': {se}")
+    return None
+
 def get_wikipedia_categories(wikipedia_url, config=None):
     wikipedia_url = sanitize_wikipedia_url(wikipedia_url)
 
@@ -476,14 +668,11 @@ def get_wikipedia_categories(wikipedia_url, config=None):
         config = DEFAULT_CONFIG
     try:
         # Parse title and language
-        splitted = wikipedia_url.split("/wiki/")
-        if len(splitted) < 2:
+        lang, title_plain = _parse_wiki_url(wikipedia_url)
+        if not title_plain:
             logging.warning("Invalid Wikipedia URL for categories: %s", wikipedia_url)
             return []
-        title = splitted[1].split("#")[0]
-        title_plain = urllib.parse.unquote(title)
-        domain = wikipedia_url.split("://")[1].split("/")[0] if "://" in wikipedia_url else "de.wikipedia.org"
-        lang = domain.split(".")[0]
+        lang = lang or "de"
         api_url = f"https://{lang}.wikipedia.org/w/api.php"
         params = {
             "action": "query",
@@ -495,9 +684,9 @@ def get_wikipedia_categories(wikipedia_url, config=None):
         }
         headers = {"User-Agent": config.get("USER_AGENT")}
         
-        r = _limited_get(api_url, params=params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
+        r = _limited_get(api_url, params=params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15), config=config)
         r.raise_for_status()
-        data = r.json()
+        data = json_loads(r.content)
         cats = []
         pages = data.get("query", {}).get("pages", {})
         for page in pages.values():
@@ -520,23 +709,26 @@ def get_wikipedia_details(wikipedia_url, config=None):
     if config is None:
         config = DEFAULT_CONFIG
     # parse title and language
-    try:
-        parts = wikipedia_url.split('/wiki/')
-        if len(parts) < 2:
-            logging.warning("Invalid Wikipedia URL for details: %s", wikipedia_url)
-            return {}
-        title = parts[1].split('#')[0]
-    except Exception as e:
-        logging.error("Error parsing title for details: %s", e)
+    lang, title = _parse_wiki_url(wikipedia_url)
+    if not title:
+        logging.warning("Invalid Wikipedia URL for details: %s", wikipedia_url)
         return {}
-    try:
-        domain = wikipedia_url.split('://')[1].split('/')[0]
-        lang = domain.split('.')[0]
-    except Exception as e:
-        logging.error("Error parsing language for details: %s", e)
-        lang = 'de'
+    lang = lang or 'de'
     endpoint = f"https://{lang}.wikipedia.org/w/api.php"
+    headers = {"User-Agent": config.get("USER_AGENT")}
+    # Infobox, Siehe-auch-Links und Bild sind unabhängig voneinander und werden parallel abgefragt
+    futures = {
+        key: _executor.submit(fetch, endpoint, title, lang, headers, config, wikipedia_url)
+        for key, fetch in (("infobox", _fetch_infobox), ("see_also", _fetch_see_also), ("image", _fetch_image))
+    }
     result = {}
+    for key, future in futures.items():
+        value = future.result()
+        if value:
+            result[key] = value
+    return result
+
+def _fetch_infobox(endpoint, title, lang, headers, config, wikipedia_url):
     # 1. Infobox via parse/text
     try:
         params = {
@@ -547,12 +739,18 @@ def get_wikipedia_details(wikipedia_url, config=None):
             'section': 0,
             "maxlag": config.get("WIKIPEDIA_MAXLAG")
         }
-        headers = {"User-Agent": config.get("USER_AGENT")}
-        
-        r = _limited_get(endpoint, params=params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
+        r = _limited_get(endpoint, params=params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15), config=config)
         r.raise_for_status()
-        html = r.json().get('parse', {}).get('text', {}).get('*', '')
-        soup = BeautifulSoup(html, 'html.parser')
+        # Seiten ohne Infobox erkennen, bevor JSON dekodiert und ein DOM aufgebaut wird;
+        # nur nach "infobox" suchen, da die Klasse auch an zweiter Stelle stehen kann
+        if b'infobox' not in r.content:
+            return None
+        html = json_loads(r.content).get('parse', {}).get('text', {}).get('*', '')
+        if not html:
+            return None
+        if lxml_html is not None:
+            return _parse_infobox_lxml(html)
+        soup = BeautifulSoup(html, _HTML_PARSER)
         table = soup.find('table', class_='infobox')
         if table:
             info = {}
@@ -563,48 +761,58 @@ def get_wikipedia_details(wikipedia_url, config=None):
                     key = th.get_text(' ', strip=True)
                     value = td.get_text(' ', strip=True)
                     info[key] = value
-            if info:
-                result['infobox'] = info
+            return info
     except Exception as e:
         logging.error("Error parsing infobox for %s: %s", wikipedia_url, e)
+    return None
+
+def _element_text(element):
+    # Entspricht BeautifulSoups get_text(' ', strip=True)
+    return ' '.join(text.strip() for text in element.itertext() if text.strip())
+
+def _parse_infobox_lxml(html):
+    info = {}
+    for row in lxml_html.fromstring(html).xpath(_INFOBOX_ROWS_XPATH):
+        info[_element_text(row.find('th'))] = _element_text(row.find('td'))
+    return info
+
+def _fetch_see_also(endpoint, title, lang, headers, config, wikipedia_url):
     # 2. See also links via parse/links
     try:
         sec_params = {'action': 'parse', 'page': title, 'prop': 'sections', 'format': 'json'}
-        rsec = _limited_get(endpoint, params=sec_params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
+        rsec = _limited_get(endpoint, params=sec_params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15), config=config)
         rsec.raise_for_status()
-        secs = rsec.json().get('parse', {}).get('sections', [])
+        secs = json_loads(rsec.content).get('parse', {}).get('sections', [])
         idx = next((s['index'] for s in secs if s.get('line', '').lower() in ('see also', 'siehe auch')), None)
         if idx:
             link_params = {'action': 'parse', 'page': title, 'prop': 'links', 'format': 'json', 'section': idx}
-            rlink = _limited_get(endpoint, params=link_params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
+            rlink = _limited_get(endpoint, params=link_params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15), config=config)
             rlink.raise_for_status()
-            links = rlink.json().get('parse', {}).get('links', [])
+            links = json_loads(rlink.content).get('parse', {}).get('links', [])
             see = []
             for l in links:
                 link_title = l.get('title') or l.get('*')
                 slug = urllib.parse.quote(link_title.replace(' ', '_'))
                 see.append(f"https://{lang}.wikipedia.org/wiki/{slug}")
-            if see:
-                result['see_also'] = see
+            return see
     except Exception as e:
         logging.error("Error fetching see_also for %s: %s", wikipedia_url, e)
+    return None
+
+def _fetch_image(endpoint, title, lang, headers, config, wikipedia_url):
     # 3. Main image via pageimages
     try:
         img_params = {'action': 'query', 'prop': 'pageimages', 'piprop': 'original', 'titles': title, 'format': 'json'}
-        rimg = _limited_get(endpoint, params=img_params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15))
+        rimg = _limited_get(endpoint, params=img_params, headers=headers, timeout=config.get('TIMEOUT_THIRD_PARTY', 15), config=config)
         rimg.raise_for_status()
-        pages = rimg.json().get('query', {}).get('pages', {})
+        pages = json_loads(rimg.content).get('query', {}).get('pages', {})
         page_data = next(iter(pages.values()))
-        img = page_data.get('original', {}).get('source') or page_data.get('thumbnail', {}).get('source')
-        if img:
-            result['image'] = img
+        return page_data.get('original', {}).get('source') or page_data.get('thumbnail', {}).get('source')
     except Exception as e:
         logging.error("Error fetching image for %s: %s", wikipedia_url, e)
-    return result
+    return None
 
 def get_wikipedia_summary_and_categories_props(wikipedia_url, config=None):
-    wikipedia_url = sanitize_wikipedia_url(wikipedia_url)
-
     """
     Retrieve title, extract, categories and Wikidata ID/URL in a single MediaWiki API call.
 
@@ -615,64 +823,147 @@ def get_wikipedia_summary_and_categories_props(wikipedia_url, config=None):
     Returns:
         A dict with keys 'title', 'extract', 'categories', 'wikidata_id', 'wikidata_url'
     """
+    return get_wikipedia_summary_and_categories_props_batch([wikipedia_url], config).get(wikipedia_url, {})
+
+# MediaWiki liefert Intro-Extracts für höchstens 20 Seiten pro Anfrage (exlimit)
+_SUMMARY_BATCH_SIZE = 20
+
+def get_wikipedia_summary_and_categories_props_batch(wikipedia_urls, config=None):
+    """
+    Retrieve title, extract, categories and Wikidata ID/URL for several articles.
+
+    Uncached URLs are grouped by language and queried with up to 20 titles
+    per MediaWiki request; each result is cached individually.
+
+    Args:
+        wikipedia_urls: Iterable of Wikipedia article URLs
+        config: Configuration dict with TIMEOUT_THIRD_PARTY
+
+    Returns:
+        A dict mapping each URL to the dict get_wikipedia_summary_and_categories_props returns
+    """
     if config is None:
         config = DEFAULT_CONFIG
-    # === Wikipedia summary caching ===
-    if config.get("CACHE_ENABLED") and config.get("CACHE_WIKIPEDIA_ENABLED"):
-        cache_path = get_cache_path(config.get("CACHE_DIR", "cache"), "wikipedia", wikipedia_url, suffix="_summary.json")
-        cached = load_cache(cache_path)
-        if cached is not None:
-            logging.debug(f"Loaded Wikipedia summary cache for {wikipedia_url}")
-            return cached
-        
-    try:
-        parts = wikipedia_url.split('/wiki/')
-        if len(parts) < 2:
-            logging.warning("Invalid Wikipedia URL: %s", wikipedia_url)
-            return {}
-        title = parts[1].split('#')[0]
-    except Exception as e:
-        logging.error("Error parsing title from URL: %s", e)
-        return {}
-    try:
-        domain = wikipedia_url.split('://')[1].split('/')[0]
-        lang = domain.split('.')[0]
-    except Exception as e:
-        logging.error("Error parsing language from URL: %s", e)
-        lang = 'de'
+    use_cache = config.get("CACHE_ENABLED") and config.get("CACHE_WIKIPEDIA_ENABLED")
+    results = {}
+    pending = {}  # lang -> {title: [(url, sanitized_url), ...]}
+    for url in dict.fromkeys(wikipedia_urls):
+        sanitized = sanitize_wikipedia_url(url)
+        # === Wikipedia summary caching ===
+        if use_cache:
+            cached = wiki_cache.get("summary", sanitized, config)
+            if cached is not None:
+                logging.debug(f"Loaded Wikipedia summary cache for {sanitized}")
+                results[url] = cached
+                continue
+        lang, title = _parse_wiki_url(sanitized)
+        if not title:
+            logging.warning("Invalid Wikipedia URL: %s", url)
+            results[url] = {}
+            continue
+        title = title.replace('_', ' ')
+        lang = lang or 'de'
+        pending.setdefault(lang, {}).setdefault(title, []).append((url, sanitized))
+
+    for lang, titles in pending.items():
+        title_list = list(titles)
+        fetched = {}
+        for start in range(0, len(title_list), _SUMMARY_BATCH_SIZE):
+            chunk = title_list[start:start + _SUMMARY_BATCH_SIZE]
+            try:
+                pages = _fetch_summary_pages(lang, chunk, config)
+            except Exception as e:
+                logging.error("Error fetching wiki summary and categories: %s", e)
+                pages = {}
+            for title in chunk:
+                page = pages.get(title)
+                for url, sanitized in titles[title]:
+                    if page is None:
+                        results[url] = {}
+                        continue
+                    result = {
+                        'title': page.get('title'),
+                        'extract': page.get('extract', ''),
+                        'categories': [c.get('title','').split('Category:',1)[-1] for c in page.get('categories', [])],
+                        'wikidata_id': page.get('pageprops', {}).get('wikibase_item')
+                    }
+                    wid = result['wikidata_id']
+                    result['wikidata_url'] = f"https://www.wikidata.org/wiki/{wid}" if wid else None
+                    fetched[sanitized] = result
+                    results[url] = result
+        # Summary-Cache pro Sprache in einer Transaktion schreiben
+        if use_cache and fetched:
+            wiki_cache.put_many("summary", fetched, config)
+            logging.debug(f"Saved {len(fetched)} Wikipedia summaries to cache")
+    return results
+
+def _fetch_summary_pages(lang, titles, config):
+    """
+    Query extracts, categories and Wikidata IDs for up to 20 titles of one language.
+
+    Follows API continuation and maps every requested title to its page via
+    the normalized and redirects tables of the response.
+    """
     endpoint = f"https://{lang}.wikipedia.org/w/api.php"
     params = {
         'action': 'query',
         'format': 'json',
         'prop': 'extracts|categories|pageprops',
         'ppprop': 'wikibase_item',
-        'titles': title,
+        'titles': '|'.join(titles),
+        'redirects': 1,
         'exintro': 1,
         'explaintext': 1,
+        'exlimit': 'max',
         'cllimit': 'max',
         'clshow': '!hidden',
         "maxlag": config.get("WIKIPEDIA_MAXLAG")
     }
     headers = {"User-Agent": config.get("USER_AGENT")}
-    
-    try:
-        r = _limited_get(endpoint, params=params, headers=headers, timeout=config.get("TIMEOUT_THIRD_PARTY", 15))
+    pages = {}
+    normalized = {}
+    redirects = {}
+    while True:
+        r = _limited_get(endpoint, params=params, headers=headers, timeout=config.get("TIMEOUT_THIRD_PARTY", 15), config=config)
         r.raise_for_status()
-        pages = r.json().get('query', {}).get('pages', {})
-        page = next(iter(pages.values()))
-        result = {
-            'title': page.get('title'),
-            'extract': page.get('extract', ''),
-            'categories': [c.get('title','').split('Category:',1)[-1] for c in page.get('categories', [])],
-            'wikidata_id': page.get('pageprops', {}).get('wikibase_item')
-        }
-        wid = result['wikidata_id']
-        result['wikidata_url'] = f"https://www.wikidata.org/wiki/{wid}" if wid else None
-        # Save summary cache
-        if config.get("CACHE_ENABLED") and config.get("CACHE_WIKIPEDIA_ENABLED"):
-            save_cache(cache_path, result)
-            logging.debug(f"Saved Wikipedia summary cache for {wikipedia_url}")
-        return result
-    except Exception as e:
-        logging.error("Error fetching wiki summary and categories: %s", e)
-        return {}
+        data = json_loads(r.content)
+        query = data.get('query', {})
+        normalized.update((n.get('from'), n.get('to')) for n in query.get('normalized', []))
+        redirects.update((n.get('from'), n.get('to')) for n in query.get('redirects', []))
+        # Bei mehreren Titeln verteilt MediaWiki Extracts und Kategorien auf Fortsetzungsanfragen
+        for page_id, page in query.get('pages', {}).items():
+            merged = pages.setdefault(page_id, {})
+            for key, value in page.items():
+                if key == 'categories':
+                    merged.setdefault('categories', []).extend(value)
+                else:
+                    merged.setdefault(key, value)
+        if 'continue' not in data:
+            break
+        params = {**params, **data['continue']}
+    by_title = {page.get('title'): page for page in pages.values()}
+    result = {}
+    for title in titles:
+        target = normalized.get(title, title)
+        target = redirects.get(target, target)
+        result[title] = by_title.get(target)
+    return result
+
+# Async-Varianten: blockierende Aufrufe laufen in Worker-Threads, Drosselung bleibt bei _limited_get
+async def aget_wikipedia_extract(wikipedia_url, config=None):
+    """
+    Async variant of get_wikipedia_extract for use inside an event loop.
+    """
+    return await asyncio.to_thread(get_wikipedia_extract, wikipedia_url, config)
+
+async def aget_wikipedia_details(wikipedia_url, config=None):
+    """
+    Async variant of get_wikipedia_details for use inside an event loop.
+    """
+    return await asyncio.to_thread(get_wikipedia_details, wikipedia_url, config)
+
+async def aget_wikipedia_summary_and_categories_props_batch(wikipedia_urls, config=None):
+    """
+    Async variant of get_wikipedia_summary_and_categories_props_batch for use inside an event loop.
+    """
+    return await asyncio.to_thread(get_wikipedia_summary_and_categories_props_batch, wikipedia_urls, config)
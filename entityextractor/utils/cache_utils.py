@@ -1,13 +1,65 @@
 import os
-import json
+import mmap
+import functools
+import base64
 import hashlib
 import logging
+import tempfile
 
+from entityextractor.utils.json_utils import json_dumps_bytes, json_loads, orjson
 
+# Größere Cache-Dateien per mmap lesen (orjson parst den Puffer ohne Kopie)
+_MMAP_THRESHOLD = 64 * 1024
+
+# Format der Cache-Dateinamen: "b32" = 128-Bit-SHA-256-Präfix in Base32 (26 Zeichen),
+# "hex" = vollständiger SHA-256-Hexdigest (64 Zeichen, Format älterer Caches, die bei
+# "b32" beim ersten Zugriff umbenannt werden); vor dem ersten get_cache_path-Aufruf setzen,
+# da Pfade memoisiert werden
+CACHE_KEY_DIGEST = "b32"
+
+
+def _key_digest(key):
+    # Kein Sicherheitszweck: usedforsecurity=False umgeht FIPS-Prüfungen, OpenSSL nutzt SHA-NI falls vorhanden
+    return hashlib.sha256(key.encode("utf-8"), usedforsecurity=False)
+
+
+def _key_hash(key):
+    digest = _key_digest(key)
+    if CACHE_KEY_DIGEST == "hex":
+        return digest.hexdigest()
+    return base64.b32encode(digest.digest()[:16]).rstrip(b"=").decode("ascii").lower()
+
+
+def _migrate_legacy(namespace_dir, key, suffix, path):
+    """
+    Rename a cache file with the older hex name to path, if one exists.
+    """
+    legacy_path = os.path.join(namespace_dir, f"{_key_digest(key).hexdigest()}{suffix}")
+    try:
+        os.replace(legacy_path, path)
+        logging.debug(f"Migrated cache file {legacy_path} to {path}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logging.warning(f"Failed to migrate cache file {legacy_path}: {e}")
+
+
+@functools.lru_cache(maxsize=256)
+def _ensure_namespace(cache_dir, namespace):
+    namespace_dir = os.path.join(cache_dir, namespace)
+    os.makedirs(namespace_dir, exist_ok=True)
+    return namespace_dir
+
+
+@functools.lru_cache(maxsize=8192)
 def get_cache_path(cache_dir, namespace, key, suffix=".json"):
     """
     Compute the cache path for a given key under a namespace.
 
+    Paths are memoized, so the directory is created and the key hashed only
+    once per (cache_dir, namespace, key, suffix). With the "b32" digest a
+    file under the older hex name is renamed to the new path on first use.
+
     Args:
         cache_dir: Base cache directory
         namespace: Sub-directory under cache_dir
@@ -16,36 +68,73 @@ def get_cache_path(cache_dir, namespace, key, suffix=".json"):
 
     Returns:
         Full path for the cache file, ensuring the directory exists.
+        The file name is derived from the key as selected by CACHE_KEY_DIGEST.
     """
-    namespace_dir = os.path.join(cache_dir, namespace)
-    os.makedirs(namespace_dir, exist_ok=True)
-    key_hash = hashlib.sha256(key.encode("utf-8")).hexdigest()
-    return os.path.join(namespace_dir, f"{key_hash}{suffix}")
+    namespace_dir = _ensure_namespace(cache_dir, namespace)
+    path = os.path.join(namespace_dir, f"{_key_hash(key)}{suffix}")
+    if CACHE_KEY_DIGEST != "hex" and not os.path.exists(path):
+        _migrate_legacy(namespace_dir, key, suffix, path)
+    return path
 
 
 def load_cache(cache_path):
     """
     Load JSON data from cache_path if it exists.
     Returns None if not present or on failure.
+
+    Files larger than _MMAP_THRESHOLD are memory-mapped and parsed in place
+    when orjson is available.
     """
-    if os.path.exists(cache_path):
-        try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            logging.debug(f"Loaded cache from {cache_path}")
-            return data
-        except Exception as e:
-            logging.warning(f"Failed to load cache {cache_path}: {e}")
+    # open() direkt versuchen statt vorher os.path.exists: ein Syscall weniger pro Cache-Miss
+    try:
+        with open(cache_path, "rb") as f:
+            if orjson is not None and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    data = orjson.loads(view)
+            else:
+                data = json_loads(f.read())
+        logging.debug(f"Loaded cache from {cache_path}")
+        return data
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.warning(f"Failed to load cache {cache_path}: {e}")
     return None
 
 
+def _write_atomic(path, buf):
+    cache_dir = os.path.dirname(path)
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except FileNotFoundError:
+        # Verzeichnis wurde nach dem (gecachten) Anlegen gelöscht, z. B. beim Leeren des Caches
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        try:
+            view = memoryview(buf)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def save_cache(cache_path, data):
     """
     Save JSON-serializable data to cache_path.
+
+    The data is serialized once and written to a temporary file that then
+    replaces cache_path, so readers never see a partially written file.
     """
     try:
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(data, f)
+        _write_atomic(cache_path, json_dumps_bytes(data))
         logging.debug(f"Saved cache to {cache_path}")
     except Exception as e:
         logging.warning(f"Failed to save cache {cache_path}: {e}")
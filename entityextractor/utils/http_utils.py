@@ -0,0 +1,47 @@
+"""
+HTTP utilities for the Entity Extractor.
+
+This module creates pooled requests sessions so that the service modules reuse
+TCP/TLS connections instead of opening a new connection for every request.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+
+def create_session(config, pool_size=32):
+    """
+    Create a requests.Session with a pooled, retrying HTTPS adapter.
+
+    Transient errors (connection resets, 429, 5xx) are retried inside urllib3
+    with jittered exponential backoff (HTTP_RETRY_TOTAL,
+    HTTP_RETRY_BACKOFF_FACTOR, HTTP_RETRY_BACKOFF_JITTER) and Retry-After is
+    honored. After the last attempt the response is returned instead of
+    raising, so callers keep using raise_for_status(). Responses are requested
+    compressed with every encoding urllib3 can decode (Brotli if the brotli
+    package is installed, otherwise gzip/deflate).
+
+    Args:
+        config: Configuration dictionary (USER_AGENT, HTTP_RETRY_*)
+        pool_size: Number of pooled connections per host
+
+    Returns:
+        The configured session
+    """
+    retry = Retry(
+        total=config.get("HTTP_RETRY_TOTAL", 5),
+        backoff_factor=config.get("HTTP_RETRY_BACKOFF_FACTOR", 0.5),
+        backoff_jitter=config.get("HTTP_RETRY_BACKOFF_JITTER", 0.3),
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = config.get("USER_AGENT")
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    return session
@@ -0,0 +1,67 @@
+"""
+JSON utilities for the Entity Extractor.
+
+This module wraps orjson when it is installed and falls back to the
+standard library json module otherwise. LLM output is parsed with
+json_repair when available so that trailing commas, smart quotes or
+surrounding prose do not discard an otherwise usable answer.
+"""
+
+import json
+
+from entityextractor.utils.text_utils import clean_json_from_markdown
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from json_repair import repair_json
+except ImportError:
+    repair_json = None
+
+
+def json_loads(data):
+    """
+    Parse JSON from str or bytes.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj):
+    """
+    Serialize obj to UTF-8 encoded JSON bytes (non-ASCII characters unescaped).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def json_dumps(obj):
+    """
+    Serialize obj to a JSON string (non-ASCII characters unescaped).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def json_loads_llm(raw_text):
+    """
+    Parse JSON produced by an LLM, tolerating Markdown fences and minor syntax errors.
+
+    Args:
+        raw_text: The raw model output
+
+    Returns:
+        The parsed JSON value
+
+    Raises:
+        ValueError: If the text cannot be parsed (or repaired) as JSON
+    """
+    if repair_json is not None:
+        return json_loads(repair_json(raw_text))
+    return json_loads(clean_json_from_markdown(raw_text))
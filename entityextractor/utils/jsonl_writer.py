@@ -0,0 +1,74 @@
+"""
+Buffered JSONL writer for the Entity Extractor.
+
+This module keeps one append handle per output file open for the lifetime of
+the process instead of opening and closing the file for every record.
+"""
+
+import atexit
+import logging
+import os
+import threading
+
+from entityextractor.utils.json_utils import json_dumps_bytes
+
+
+class JsonlWriter:
+    """
+    A thread-safe, buffered JSONL appender.
+
+    Records are written into a 64 KB buffer and flushed every flush_every
+    records and at interpreter exit.
+    """
+    def __init__(self, path, flush_every=1000, buffer_size=64 * 1024):
+        self.path = path
+        self.flush_every = flush_every
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.f = open(path, "ab", buffering=buffer_size)
+
+    def write(self, obj):
+        line = json_dumps_bytes(obj)
+        with self.lock:
+            self.f.write(line)
+            self.f.write(b"\n")
+            self.pending += 1
+            if self.pending >= self.flush_every:
+                self.f.flush()
+                self.pending = 0
+
+    def flush(self):
+        with self.lock:
+            if not self.f.closed:
+                self.f.flush()
+            self.pending = 0
+
+    def close(self):
+        with self.lock:
+            if not self.f.closed:
+                self.f.close()
+
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def get_jsonl_writer(path, flush_every=1000):
+    """
+    Return the process-wide JsonlWriter for path, creating it on first use.
+    """
+    key = os.path.abspath(path)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = JsonlWriter(path, flush_every=flush_every)
+        return writer
+
+
+@atexit.register
+def _close_writers():
+    for writer in list(_writers.values()):
+        try:
+            writer.close()
+        except Exception as e:
+            logging.warning(f"Failed to close JSONL writer {writer.path}: {e}")
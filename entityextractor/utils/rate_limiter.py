@@ -1,44 +1,252 @@
+import asyncio
 import time
 import threading
 import logging
 import random
 from functools import wraps
+from urllib.parse import urlsplit
 
 class RateLimiter:
     """
-    A simple thread-safe rate limiter with exponential backoff on HTTP 429 errors.
+    A thread-safe token-bucket rate limiter with exponential backoff on HTTP 429 errors.
+
+    The bucket holds up to max_calls tokens and refills continuously at
+    max_calls per period (measured with time.monotonic). The lock is only
+    held to refill and take a token; waiting threads sleep outside of it,
+    so concurrent callers do not queue behind a sleeping thread.
+
+    Set retry_on_429=False when the wrapped call already retries 429
+    responses itself (e.g. a session with a urllib3 Retry adapter).
     """
-    def __init__(self, max_calls, period, backoff_base=1, backoff_max=60):
+    def __init__(self, max_calls, period, backoff_base=1, backoff_max=60, retry_on_429=True):
         self.max_calls = max_calls
         self.period = period
         self.backoff_base = backoff_base
         self.backoff_max = backoff_max
+        self.retry_on_429 = retry_on_429
+        self.rate = max_calls / period
+        self.tokens = float(max_calls)
+        self.last_refill = time.monotonic()
         self.lock = threading.Lock()
-        self.calls = []
+
+    def acquire(self):
+        """
+        Block until a call is allowed and consume one token.
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.max_calls, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                sleep_t = (1 - self.tokens) / self.rate
+            logging.info(f"[RateLimiter] Rate limit reached, sleeping {sleep_t:.2f}s")
+            time.sleep(sleep_t)
 
     def __call__(self, func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            with self.lock:
-                now = time.time()
-                # retain only calls within period
-                self.calls = [t for t in self.calls if t > now - self.period]
-                if len(self.calls) >= self.max_calls:
-                    sleep_t = self.calls[0] + self.period - now
-                    logging.info(f"[RateLimiter] Rate limit reached, sleeping {sleep_t:.2f}s")
-                    time.sleep(sleep_t)
-                self.calls.append(time.time())
+            attempt = 0
+            while True:
+                self.acquire()
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    resp = getattr(e, 'response', None)
+                    if self.retry_on_429 and resp is not None and getattr(resp, 'status_code', None) == 429:
+                        # exponential backoff with jitter
+                        attempt += 1
+                        expo = min(self.backoff_base * 2 ** attempt, self.backoff_max)
+                        jitter = expo * random.uniform(-0.1, 0.1)
+                        sleep_t = expo + jitter
+                        logging.warning(f"[RateLimiter] 429 received, backing off for {sleep_t:.2f}s")
+                        time.sleep(sleep_t)
+                        continue
+                    raise
+        return wrapper
+
+
+class PerHostRateLimiter:
+    """
+    A decorator applying a separate RateLimiter per target host.
+
+    The decorated function must take the URL as its first argument. Hosts
+    listed in host_max_calls (exact host or parent domain, e.g.
+    "wikipedia.org") get their own call budget per period; all other hosts
+    use default_max_calls. Each host keeps its own backoff state, so a
+    throttled host does not block requests to unrelated hosts.
+    """
+    def __init__(self, default_max_calls, period, backoff_base=1, backoff_max=60, host_max_calls=None, retry_on_429=True):
+        self.default_max_calls = default_max_calls
+        self.period = period
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_on_429 = retry_on_429
+        self.host_max_calls = host_max_calls or {}
+        self.lock = threading.Lock()
+        self.limiters = {}
+
+    def _max_calls_for(self, host):
+        for suffix, max_calls in self.host_max_calls.items():
+            if host == suffix or host.endswith("." + suffix):
+                return max_calls
+        return self.default_max_calls
+
+    def __call__(self, func):
+        wrapped = {}
+
+        @wraps(func)
+        def wrapper(url, *args, **kwargs):
+            host = urlsplit(url).netloc
+            limited = wrapped.get(host)
+            if limited is None:
+                with self.lock:
+                    limited = wrapped.get(host)
+                    if limited is None:
+                        limiter = self.limiters.get(host)
+                        if limiter is None:
+                            limiter = self.limiters[host] = RateLimiter(
+                                self._max_calls_for(host), self.period, self.backoff_base, self.backoff_max,
+                                retry_on_429=self.retry_on_429
+                            )
+                        limited = wrapped[host] = limiter(func)
+            return limited(url, *args, **kwargs)
+        return wrapper
+
+
+class RateLimitedDispatcher:
+    """
+    An asyncio token-bucket dispatcher for request- and token-per-minute limits.
+
+    Both buckets refill continuously and are topped up lazily on every
+    acquire, so no background task is needed. Callers await acquire() with
+    the estimated token cost before sending a request. The remaining quota
+    reported by the API can be fed back via update_from_headers().
+    """
+    def __init__(self, rpm=None, tpm=None):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.requests_available = float(rpm) if rpm else 0.0
+        self.tokens_available = float(tpm) if tpm else 0.0
+        self.last_refill = time.monotonic()
+        self.lock = None
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.last_refill = now
+        if self.rpm:
+            self.requests_available = min(self.rpm, self.requests_available + elapsed * self.rpm / 60.0)
+        if self.tpm:
+            self.tokens_available = min(self.tpm, self.tokens_available + elapsed * self.tpm / 60.0)
+
+    async def acquire(self, tokens=0):
+        """
+        Wait until one request and the given number of tokens are available, then consume them.
+        """
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        # A single request can never need more than the whole bucket
+        if self.tpm:
+            tokens = min(tokens, self.tpm)
+        async with self.lock:
+            while True:
+                self._refill()
+                wait = 0.0
+                if self.rpm and self.requests_available < 1:
+                    wait = (1 - self.requests_available) * 60.0 / self.rpm
+                if self.tpm and self.tokens_available < tokens:
+                    wait = max(wait, (tokens - self.tokens_available) * 60.0 / self.tpm)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            if self.rpm:
+                self.requests_available -= 1
+            if self.tpm:
+                self.tokens_available -= tokens
+
+    def update_from_headers(self, headers):
+        """
+        Lower the buckets to the remaining quota reported by x-ratelimit-remaining-* headers.
+        """
+        remaining_requests = headers.get("x-ratelimit-remaining-requests")
+        remaining_tokens = headers.get("x-ratelimit-remaining-tokens")
+        try:
+            if self.rpm and remaining_requests is not None:
+                self.requests_available = min(self.requests_available, float(remaining_requests))
+            if self.tpm and remaining_tokens is not None:
+                self.tokens_available = min(self.tokens_available, float(remaining_tokens))
+        except ValueError:
+            logging.debug(f"[RateLimitedDispatcher] Unparseable rate-limit headers: {remaining_requests}, {remaining_tokens}")
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    A thread-safe AIMD concurrency limiter for HTTP calls.
+
+    The number of calls allowed in flight grows additively by `increase` on
+    every successful response and shrinks multiplicatively by `decrease` when
+    the server throttles (HTTP 429/503). A throttled response also pauses
+    the limiter as a whole: no new call starts until the Retry-After
+    duration, or an exponential backoff with full jitter, has passed. The
+    throttled response itself is returned right away.
+    """
+    def __init__(self, max_limit, increase=0.5, decrease=0.5, backoff_base=1, backoff_max=60, min_limit=1):
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self.throttled = 0
+        self.paused_until = 0.0
+        self.cond = threading.Condition()
+
+    def _retry_after(self, resp):
+        value = resp.headers.get("Retry-After") if getattr(resp, "headers", None) is not None else None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    def __call__(self, func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.cond:
+                while True:
+                    pause = self.paused_until - time.monotonic()
+                    if pause > 0:
+                        self.cond.wait(pause)
+                    elif self.in_flight >= int(self.limit):
+                        self.cond.wait()
+                    else:
+                        break
+                self.in_flight += 1
+            resp = None
             try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                resp = getattr(e, 'response', None)
-                if resp is not None and getattr(resp, 'status_code', None) == 429:
-                    # exponential backoff with jitter
-                    expo = min(self.backoff_base * 2 ** len(self.calls), self.backoff_max)
-                    jitter = expo * random.uniform(-0.1, 0.1)
-                    sleep_t = expo + jitter
-                    logging.warning(f"[RateLimiter] 429 received, backing off for {sleep_t:.2f}s")
-                    time.sleep(sleep_t)
-                    return wrapper(*args, **kwargs)
-                raise
+                resp = func(*args, **kwargs)
+                return resp
+            finally:
+                throttled = getattr(resp, "status_code", None) in (429, 503)
+                with self.cond:
+                    self.in_flight -= 1
+                    if throttled:
+                        self.limit = max(self.min_limit, self.limit * self.decrease)
+                        self.throttled += 1
+                        retry_after = self._retry_after(resp)
+                        if retry_after is not None:
+                            pause = min(retry_after, self.backoff_max)
+                        else:
+                            pause = random.uniform(0, min(self.backoff_base * 2 ** self.throttled, self.backoff_max))
+                        # Gemeinsame Pause vor dem Aufwecken setzen, damit Wartende nicht sofort neu anfragen
+                        self.paused_until = max(self.paused_until, time.monotonic() + pause)
+                        logging.warning(f"[AdaptiveConcurrencyLimiter] HTTP {resp.status_code}, concurrency {self.limit:.1f}, pausing new calls for {pause:.2f}s")
+                    elif resp is not None:
+                        self.limit = min(self.max_limit, self.limit + self.increase)
+                        self.throttled = 0
+                    self.cond.notify_all()
         return wrapper
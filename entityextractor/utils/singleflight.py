@@ -0,0 +1,40 @@
+"""
+Single-flight request coalescing for the Entity Extractor.
+
+Concurrent callers asking for the same key share one in-flight call instead
+of each issuing their own request.
+"""
+
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls per key.
+
+    The first caller for a key runs the function; callers arriving while it
+    is still running wait for and receive the same result (or exception).
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.inflight = {}
+
+    def do(self, key, func, *args, **kwargs):
+        with self.lock:
+            future = self.inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self.inflight[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = func(*args, **kwargs)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                self.inflight.pop(key, None)
@@ -5,6 +5,18 @@ This module provides functions for processing and cleaning text data.
 """
 
 import re
+from typing import Iterator
+
+# Übersetzungstabelle: in JSON unzulässige Steuerzeichen -> Leerzeichen (erlaubt bleiben \b, \t, \n, \f, \r)
+_CTRL_TABLE = {i: 0x20 for i in range(0x20) if i not in (0x08, 0x09, 0x0a, 0x0c, 0x0d)}
+# Markdown-Codeblock am Anfang der Antwort (```json ... ```), Sprachangabe beliebig;
+# der erste schließende Zaun am Zeilenanfang (oder am Textende) beendet den Block,
+# nachfolgender Text wird verworfen
+_FENCE = re.compile(r'\A```[\w+-]*\s*(.*?)\s*(?:^```[ \t]*$|```\s*\Z)', re.DOTALL | re.MULTILINE)
+_FENCE_OPEN = re.compile(r'^```[\w+-]*\s*')
+_WIKIPEDIA_URL = re.compile(r"^https?://[a-z]{2}\.wikipedia\.org/wiki/[\w\-%]+")
+_TRAILING_DOTS = re.compile(r'[.]{3,}$')
+_TRAILING_ELLIPSIS = re.compile(r'…$')
 
 def clean_json_from_markdown(raw_text):
     """
@@ -18,39 +30,13 @@ def clean_json_from_markdown(raw_text):
     """
     raw_text = raw_text.strip()
     if raw_text.startswith("```"):
-        lines = raw_text.splitlines()
-        # Skip first and last line if they contain Markdown markers
-        for i in range(len(lines)):
-            if lines[i].startswith("```"):
-                if i == 0:
-                    lines[i] = ""
-                    break
-        # Go through lines from bottom to top to find the last Markdown marker
-        for i in range(len(lines) - 1, -1, -1):
-            if lines[i].startswith("```"):
-                lines[i] = ""
-                break
-                
-        raw_text = "\n".join([line for line in lines if line])
-    
-    # Handle case where only the first line has ```json
-    lines = raw_text.splitlines()
-    if lines and lines[0].startswith("```"):
-        lines[0] = "```"
-        raw_text = "\n".join(lines)
+        match = _FENCE.match(raw_text)
+        # Ohne schließenden Zaun (abgeschnittene Antwort) nur die öffnende Zeile entfernen
+        raw_text = match.group(1) if match else _FENCE_OPEN.sub('', raw_text, count=1)
     
-    # Remove invalid control characters
+    # Replace invalid control characters with spaces
     # Allowed control characters in JSON: \b, \f, \n, \r, \t
-    clean_text = ""
-    for char in raw_text:
-        # Only keep printable characters and allowed control characters
-        if ord(char) >= 32 or char in '\b\f\n\r\t':
-            clean_text += char
-        else:
-            # Replace invalid control characters with spaces
-            clean_text += ' '
-    
-    return clean_text
+    return raw_text.translate(_CTRL_TABLE)
 
 # Alias for compatibility
 clean_json_response = clean_json_from_markdown
@@ -65,8 +51,7 @@ def is_valid_wikipedia_url(url):
     Returns:
         Boolean indicating if the URL is a valid Wikipedia URL
     """
-    pattern = re.compile(r"^https?://[a-z]{2}\.wikipedia\.org/wiki/[\w\-%]+")
-    return bool(pattern.match(url))
+    return bool(_WIKIPEDIA_URL.match(url))
 
 def strip_trailing_ellipsis(text):
     """
@@ -80,32 +65,33 @@ def strip_trailing_ellipsis(text):
     """
     if text:
         # Remove trailing "..." or "…"
-        text = re.sub(r'[.]{3,}$', '', text)
-        text = re.sub(r'…$', '', text)
+        text = _TRAILING_DOTS.sub('', text)
+        text = _TRAILING_ELLIPSIS.sub('', text)
         return text.rstrip()
     return text
 
 # Neue Funktion für Text-Chunking
-def chunk_text(text: str, size: int, overlap: int = 0) -> list:
+def chunk_text(text: str, size: int, overlap: int = 0) -> Iterator[str]:
     """
     Teilt einen Text in überlappende Chunks auf.
 
+    Die Chunks werden einzeln erzeugt; wer eine Liste braucht, ruft
+    list(chunk_text(...)) auf.
+
     Args:
         text: Der vollständige Text.
         size: Maximale Zeichenlänge eines Chunks.
         overlap: Anzahl Zeichen, die sich zwischen Chunks überlappen.
 
-    Returns:
-        Liste von Text-Chunks.
+    Yields:
+        Text-Chunks in Reihenfolge.
     """
-    chunks = []
     start = 0
     length = len(text)
     while start < length:
         end = min(start + size, length)
-        chunk = text[start:end]
-        chunks.append(chunk)
+        yield text[start:end]
         if end == length:
             break
-        start = max(end - overlap, 0)
-    return chunks
+        # Mindestens ein Zeichen weiterrücken, auch wenn overlap >= size
+        start = max(end - overlap, start + 1)
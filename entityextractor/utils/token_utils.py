@@ -0,0 +1,75 @@
+"""
+Token counting utilities for the Entity Extractor.
+
+Uses tiktoken when it is installed and a characters/4 estimate otherwise.
+"""
+
+import functools
+import logging
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Kontextfenster (Tokens) nach Modellpräfix; der längste passende Präfix gewinnt
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-4.1": 1047576,
+    "gpt-4o": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4-1106": 128000,
+    "gpt-4-0125": 128000,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+    "o1": 200000,
+    "o3": 200000,
+    "o4": 200000,
+}
+DEFAULT_CONTEXT_WINDOW = 128000
+
+
+@functools.lru_cache(maxsize=16)
+def _get_encoding(model):
+    # tiktoken lädt die BPE-Datei beim ersten Zugriff herunter; offline o. Ä. -> None (Schätzung), einmal geloggt
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logging.warning(f"tiktoken encoding for {model} unavailable, estimating token counts: {e}")
+        return None
+
+
+def count_tokens(text, model):
+    """
+    Count (or, without a usable tiktoken encoding, estimate) the number of tokens in text.
+    """
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        try:
+            return len(encoding.encode(text))
+        except Exception as e:
+            logging.debug(f"tiktoken failed to encode text, estimating token count: {e}")
+    return len(text) // 4 + 1
+
+
+@functools.lru_cache(maxsize=64)
+def count_tokens_cached(text, model):
+    """
+    Like count_tokens, memoized for strings that repeat such as system prompts.
+    """
+    return count_tokens(text, model)
+
+
+@functools.lru_cache(maxsize=32)
+def context_window(model):
+    """
+    Return the context window size in tokens for model.
+    """
+    matches = [prefix for prefix in MODEL_CONTEXT_WINDOWS if model.startswith(prefix)]
+    if not matches:
+        return DEFAULT_CONTEXT_WINDOW
+    return MODEL_CONTEXT_WINDOWS[max(matches, key=len)]